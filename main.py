@@ -18,6 +18,12 @@ import sys
 import logging
 from pathlib import Path
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -25,7 +31,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from src.core import ensure_directories_exist, SYSTEM_CONFIG
 from src.economics import get_mce
 from src.agents import get_soul_parser
-from src.mcp import mcp_server
+from src.mcp import get_mcp_server
 
 
 # ============================================================================
@@ -113,4 +119,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop must be installed before asyncio.run creates the event loop
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -11,16 +11,24 @@ Scans Python AST for security violations including:
 """
 
 import ast
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, Iterable, List, Set, Tuple
 from dataclasses import dataclass
 import logging
 
+from .violations import ViolationList
+
 logger = logging.getLogger(__name__)
 
+# Leaf marker nodes that carry nothing worth scanning; they still count
+# towards max_ast_nodes
+_UNINTERESTING = frozenset((ast.Load, ast.Store, ast.Del))
+
 
 @dataclass
 class SecurityViolation:
     """Security violation detected in code."""
+    # Written out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("violation_type", "line_number", "description", "severity")
     violation_type: str
     line_number: int
     description: str
@@ -93,23 +101,36 @@ class ASTScannerHook:
                 }]
                 return payload
             
-            # Check line lengths
-            for i, line in enumerate(code.split('\n'), 1):
-                if len(line) > self.max_line_length:
+            # Check line lengths by scanning newline offsets, without
+            # allocating a substring per line
+            start = 0
+            lineno = 1
+            limit = self.max_line_length
+            code_len = len(code)
+            while start <= code_len:
+                end = code.find('\n', start)
+                if end < 0:
+                    end = code_len
+                if end - start > limit:
                     payload["_halt"] = True
                     payload["security_violations"] = [{
                         "type": "line_too_long",
-                        "line": i,
-                        "description": f"Line too long: {len(line)} characters",
+                        "line": lineno,
+                        "description": f"Line too long: {end - start} characters",
                         "severity": "medium"
                     }]
                     return payload
+                start = end + 1
+                lineno += 1
             
             # Parse AST
             tree = ast.parse(code)
             
+            # Flatten the tree once; the node list serves both the
+            # complexity check and the violation scan
+            nodes, node_count = self._flatten_ast(tree)
+            
             # Check AST complexity
-            node_count = len(list(ast.walk(tree)))
             if node_count > self.max_ast_nodes:
                 payload["_halt"] = True
                 payload["security_violations"] = [{
@@ -121,23 +142,15 @@ class ASTScannerHook:
                 return payload
             
             # Scan for violations
-            violations = self._scan_ast(tree)
+            violations = self._scan_ast(nodes)
             
             if violations:
                 payload["_halt"] = True
-                payload["security_violations"] = [
-                    {
-                        "type": v.violation_type,
-                        "line": v.line_number,
-                        "description": v.description,
-                        "severity": v.severity
-                    }
-                    for v in violations
-                ]
+                payload["security_violations"] = violations
                 
                 # Log violations
                 for v in violations:
-                    logger.warning(f"Security violation: {v.violation_type} at line {v.line_number}: {v.description}")
+                    logger.warning(f"Security violation: {v['type']} at line {v['line']}: {v['description']}")
         
         except SyntaxError as e:
             payload["_halt"] = True
@@ -161,101 +174,162 @@ class ASTScannerHook:
         
         return payload
     
-    def _scan_ast(self, tree: ast.AST) -> List[SecurityViolation]:
-        """Scan AST for security violations."""
-        violations = []
+    def _flatten_ast(self, tree: ast.AST) -> Tuple[List[ast.AST], int]:
+        """
+        Flatten AST into a pre-order node list using an explicit stack.
         
-        for node in ast.walk(tree):
-            # Check for blocked imports
-            if isinstance(node, (ast.Import, ast.ImportFrom)):
-                for alias in node.names:
-                    if alias.name in self.blocked_imports:
-                        violations.append(SecurityViolation(
-                            violation_type="blocked_import",
-                            line_number=node.lineno,
-                            description=f"Import of blocked module: {alias.name}",
-                            severity="high"
-                        ))
-            
-            # Check for blocked calls
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    if node.func.id in self.blocked_calls:
-                        violations.append(SecurityViolation(
-                            violation_type="blocked_call",
-                            line_number=node.lineno,
-                            description=f"Call to blocked function: {node.func.id}",
-                            severity="high"
-                        ))
-                
-                # Check for method calls on dangerous objects
-                elif isinstance(node.func, ast.Attribute):
-                    if isinstance(node.func.value, ast.Name):
-                        obj_name = node.func.value.id
-                        method_name = node.func.attr
-                        
-                        # Dangerous subprocess calls
-                        if obj_name == "subprocess" and method_name in ["run", "call", "Popen", "check_output"]:
-                            violations.append(SecurityViolation(
-                                violation_type="dangerous_subprocess",
-                                line_number=node.lineno,
-                                description=f"Dangerous subprocess call: {obj_name}.{method_name}",
-                                severity="critical"
-                            ))
-                        
-                        # Dangerous os calls
-                        elif obj_name == "os" and method_name in ["system", "popen", "spawn*", "exec*"]:
-                            violations.append(SecurityViolation(
-                                violation_type="dangerous_os_call",
-                                line_number=node.lineno,
-                                description=f"Dangerous OS call: {obj_name}.{method_name}",
-                                severity="critical"
-                            ))
-            
-            # Check for dunder method access
-            elif isinstance(node, ast.Attribute):
-                if node.attr in self.blocked_dunder_methods:
-                    violations.append(SecurityViolation(
-                        violation_type="blocked_dunder",
-                        line_number=node.lineno,
-                        description=f"Access to blocked dunder method: {node.attr}",
-                        severity="high"
-                    ))
-            
-            # Check for string literals with suspicious content
-            elif isinstance(node, ast.Str):
-                for pattern in self.suspicious_patterns:
-                    if pattern.lower() in node.s.lower():
-                        violations.append(SecurityViolation(
-                            violation_type="suspicious_pattern",
-                            line_number=node.lineno,
-                            description=f"Suspicious pattern detected: {pattern}",
-                            severity="medium"
-                        ))
-            
-            # Check for function definitions with suspicious names
-            elif isinstance(node, ast.FunctionDef):
-                if any(pattern in node.name.lower() for pattern in self.suspicious_patterns):
-                    violations.append(SecurityViolation(
-                        violation_type="suspicious_function",
-                        line_number=node.lineno,
-                        description=f"Suspicious function name: {node.name}",
-                        severity="medium"
-                    ))
-            
-            # Check for class definitions with suspicious names
-            elif isinstance(node, ast.ClassDef):
-                if any(pattern in node.name.lower() for pattern in self.suspicious_patterns):
-                    violations.append(SecurityViolation(
-                        violation_type="suspicious_class",
-                        line_number=node.lineno,
-                        description=f"Suspicious class name: {node.name}",
-                        severity="medium"
-                    ))
+        Returns the scannable nodes together with the total node count,
+        which matches ast.walk and includes the skipped context markers.
+        """
+        nodes = []
+        node_count = 0
+        stack = [tree]
+        
+        while stack:
+            node = stack.pop()
+            node_count += 1
+            if type(node) in _UNINTERESTING:
+                continue
+            nodes.append(node)
+            # Reverse so children are visited in source order
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+        
+        return nodes, node_count
+    
+    def _scan_ast(self, nodes: Iterable[ast.AST]) -> List[Dict[str, Any]]:
+        """
+        Scan flattened AST nodes, returning violations in payload form.
+        
+        Each offence (violation type and offending name or pattern) is
+        reported once per line, so a construct repeated on one line yields
+        a single violation while distinct offences are all kept.
+        """
+        violations = ViolationList()
+        dispatch = _DISPATCH
+        
+        for node in nodes:
+            handler = dispatch.get(type(node))
+            if handler:
+                handler(self, node, violations)
         
         return violations
 
 
+# Node handlers, dispatched on the exact node type by ASTScannerHook._scan_ast
+
+def _handle_import(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check for blocked imports."""
+    for alias in node.names:
+        if alias.name in hook.blocked_imports and out.first("blocked_import", (node.lineno, alias.name)):
+            out.append({
+                "type": "blocked_import",
+                "line": node.lineno,
+                "description": f"Import of blocked module: {alias.name}",
+                "severity": "high"
+            })
+
+
+def _handle_call(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check for blocked calls and method calls on dangerous objects."""
+    func = node.func
+    func_type = type(func)
+    
+    if func_type is ast.Name:
+        if func.id in hook.blocked_calls and out.first("blocked_call", (node.lineno, func.id)):
+            out.append({
+                "type": "blocked_call",
+                "line": node.lineno,
+                "description": f"Call to blocked function: {func.id}",
+                "severity": "high"
+            })
+    
+    elif func_type is ast.Attribute and type(func.value) is ast.Name:
+        obj_name = func.value.id
+        method_name = func.attr
+        
+        # Dangerous subprocess calls
+        if (obj_name == "subprocess" and method_name in ["run", "call", "Popen", "check_output"]
+                and out.first("dangerous_subprocess", (node.lineno, method_name))):
+            out.append({
+                "type": "dangerous_subprocess",
+                "line": node.lineno,
+                "description": f"Dangerous subprocess call: {obj_name}.{method_name}",
+                "severity": "critical"
+            })
+        
+        # Dangerous os calls
+        elif (obj_name == "os" and method_name in ["system", "popen", "spawn*", "exec*"]
+                and out.first("dangerous_os_call", (node.lineno, method_name))):
+            out.append({
+                "type": "dangerous_os_call",
+                "line": node.lineno,
+                "description": f"Dangerous OS call: {obj_name}.{method_name}",
+                "severity": "critical"
+            })
+
+
+def _handle_attribute(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check for dunder method access."""
+    if node.attr in hook.blocked_dunder_methods and out.first("blocked_dunder", (node.lineno, node.attr)):
+        out.append({
+            "type": "blocked_dunder",
+            "line": node.lineno,
+            "description": f"Access to blocked dunder method: {node.attr}",
+            "severity": "high"
+        })
+
+
+def _handle_constant(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check string literals for suspicious content."""
+    if type(node.value) is not str:
+        return
+    
+    value = node.value.lower()
+    for pattern in hook.suspicious_patterns:
+        if pattern.lower() in value and out.first("suspicious_pattern", (node.lineno, pattern)):
+            out.append({
+                "type": "suspicious_pattern",
+                "line": node.lineno,
+                "description": f"Suspicious pattern detected: {pattern}",
+                "severity": "medium"
+            })
+
+
+def _handle_function_def(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check for function definitions with suspicious names."""
+    if any(pattern in node.name.lower() for pattern in hook.suspicious_patterns):
+        out.append({
+            "type": "suspicious_function",
+            "line": node.lineno,
+            "description": f"Suspicious function name: {node.name}",
+            "severity": "medium"
+        })
+
+
+def _handle_class_def(hook: ASTScannerHook, node: ast.AST, out: ViolationList) -> None:
+    """Check for class definitions with suspicious names."""
+    if any(pattern in node.name.lower() for pattern in hook.suspicious_patterns):
+        out.append({
+            "type": "suspicious_class",
+            "line": node.lineno,
+            "description": f"Suspicious class name: {node.name}",
+            "severity": "medium"
+        })
+
+
+# Keyed on exact type: AST node classes are leaf types, so a single dict
+# lookup replaces the isinstance cascade
+_DISPATCH = {
+    ast.Import: _handle_import,
+    ast.ImportFrom: _handle_import,
+    ast.Call: _handle_call,
+    ast.Attribute: _handle_attribute,
+    ast.Constant: _handle_constant,
+    ast.FunctionDef: _handle_function_def,
+    ast.ClassDef: _handle_class_def,
+}
+
+
 # Factory function for creating the hook
 def create_ast_scanner_hook(config: Dict[str, Any]) -> ASTScannerHook:
     """Create an AST scanner hook with the given configuration."""
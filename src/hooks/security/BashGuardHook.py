@@ -16,12 +16,20 @@ from typing import Dict, Any, List, Set
 from dataclasses import dataclass
 import logging
 
+from .violations import ViolationList
+
 logger = logging.getLogger(__name__)
 
+# Environment variable references: ${VAR} and $VAR
+_ENV_BRACE_RE = re.compile(r'\$\{[^}]*\}')
+_ENV_VAR_RE = re.compile(r'\$[A-Za-z_][A-Za-z0-9_]*')
+
 
 @dataclass
 class CommandViolation:
     """Security violation detected in command."""
+    # Declared by hand: dataclass(slots=True) is unavailable on Python 3.9
+    __slots__ = ("violation_type", "command", "description", "severity")
     violation_type: str
     command: str
     description: str
@@ -91,8 +99,30 @@ class BashGuardHook:
         # Max command length
         self.max_command_length = config.get("max_command_length", 1000)
         
+        # Stop at the first violation instead of aggregating a full report
+        self.fail_fast = config.get("fail_fast", False)
+        
         # Compile regex patterns
         self.compiled_patterns = [re.compile(pattern) for pattern in self.dangerous_patterns]
+        
+        # First-byte tables: a zero entry means no listed command starts
+        # with that byte, so the set lookup can be skipped entirely
+        self._blocked_firstbyte = self._build_firstbyte_table(self.blocked_commands)
+        self._allowed_firstbyte = self._build_firstbyte_table(self.allowed_commands)
+        
+        # Command chaining metacharacters (single C-level scan via isdisjoint)
+        self._metachars = frozenset(";&|`$")
+    
+    @staticmethod
+    def _build_firstbyte_table(commands: Set[str]) -> bytearray:
+        """Build a 256-entry table marking the first byte of each command."""
+        table = bytearray(256)
+        for cmd in commands:
+            if cmd:
+                # Masking folds non-ASCII into the table; collisions only
+                # cause a fall-through to the exact set lookup
+                table[ord(cmd[0]) & 0xFF] = 1
+        return table
     
     async def execute(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -148,101 +178,16 @@ class BashGuardHook:
                 return payload
             
             # Check violations
-            violations = []
-            
-            # Check blocked commands
-            if base_command in self.blocked_commands:
-                violations.append(CommandViolation(
-                    violation_type="blocked_command",
-                    command=command,
-                    description=f"Blocked command: {base_command}",
-                    severity="high"
-                ))
-            
-            # Check if command is in whitelist (if whitelist is enabled)
-            if self.allowed_commands and base_command not in self.allowed_commands:
-                violations.append(CommandViolation(
-                    violation_type="unauthorized_command",
-                    command=command,
-                    description=f"Unauthorized command: {base_command}",
-                    severity="medium"
-                ))
-            
-            # Check dangerous patterns
-            for pattern in self.compiled_patterns:
-                if pattern.search(command):
-                    violations.append(CommandViolation(
-                        violation_type="dangerous_pattern",
-                        command=command,
-                        description=f"Dangerous pattern detected: {pattern.pattern}",
-                        severity="high"
-                    ))
-            
-            # Check arguments for dangerous content
-            for i, arg in enumerate(args):
-                # Check for file paths
-                if "/" in arg:
-                    # Check if path is allowed
-                    if not any(arg.startswith(path) for path in self.allowed_paths):
-                        violations.append(CommandViolation(
-                            violation_type="unauthorized_path",
-                            command=command,
-                            description=f"Unauthorized path: {arg}",
-                            severity="medium"
-                        ))
-                
-                # Check for suspicious arguments
-                if any(pattern.search(arg) for pattern in self.compiled_patterns):
-                    violations.append(CommandViolation(
-                        violation_type="dangerous_argument",
-                        command=command,
-                        description=f"Dangerous argument: {arg}",
-                        severity="high"
-                    ))
-            
-            # Check for command chaining
-            if any(char in command for char in [";", "&", "|", "`", "$"]):
-                violations.append(CommandViolation(
-                    violation_type="command_chaining",
-                    command=command,
-                    description="Command chaining detected",
-                    severity="critical"
-                ))
-            
-            # Check for environment variable manipulation
-            if re.search(r'\$\{[^}]*\}', command) or re.search(r'\$[A-Za-z_][A-Za-z0-9_]*', command):
-                violations.append(CommandViolation(
-                    violation_type="env_variable",
-                    command=command,
-                    description="Environment variable usage detected",
-                    severity="medium"
-                ))
-            
-            # Check for redirection
-            if any(op in command for op in [">", ">>", "<", "<<", "2>", "2>>"]):
-                violations.append(CommandViolation(
-                    violation_type="redirection",
-                    command=command,
-                    description="I/O redirection detected",
-                    severity="medium"
-                ))
+            violations = self._collect_violations(command, base_command, args)
             
             # If violations found, halt execution
             if violations:
                 payload["_halt"] = True
-                payload["security_violations"] = [
-                    {
-                        "type": v.violation_type,
-                        "command": v.command,
-                        "description": v.description,
-                        "severity": v.severity
-                    }
-                    for v in violations
-                ]
+                payload["security_violations"] = violations
                 
                 # Log violations
                 for v in violations:
-                    logger.warning(f"Command violation: {v.violation_type} - {v.description}")
+                    logger.warning(f"Command violation: {v['type']} - {v['description']}")
         
         except Exception as e:
             payload["_halt"] = True
@@ -256,6 +201,121 @@ class BashGuardHook:
         
         return payload
     
+    def _collect_violations(
+        self,
+        command: str,
+        base_command: str,
+        args: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run all command checks and collect violations in payload form.
+        
+        With fail_fast enabled, returns as soon as any check reports.
+        Repeated arguments are reported once.
+        """
+        violations = ViolationList()
+        
+        # Check blocked commands
+        if (base_command and self._blocked_firstbyte[ord(base_command[0]) & 0xFF]
+                and base_command in self.blocked_commands):
+            violations.append({
+                "type": "blocked_command",
+                "command": command,
+                "description": f"Blocked command: {base_command}",
+                "severity": "high"
+            })
+            if self.fail_fast:
+                return violations
+        
+        # Check if command is in whitelist (if whitelist is enabled)
+        if self.allowed_commands and not (
+            base_command and self._allowed_firstbyte[ord(base_command[0]) & 0xFF]
+            and base_command in self.allowed_commands
+        ):
+            violations.append({
+                "type": "unauthorized_command",
+                "command": command,
+                "description": f"Unauthorized command: {base_command}",
+                "severity": "medium"
+            })
+            if self.fail_fast:
+                return violations
+        
+        # Check dangerous patterns
+        for pattern in self.compiled_patterns:
+            if pattern.search(command):
+                violations.append({
+                    "type": "dangerous_pattern",
+                    "command": command,
+                    "description": f"Dangerous pattern detected: {pattern.pattern}",
+                    "severity": "high"
+                })
+                if self.fail_fast:
+                    return violations
+        
+        # Check arguments for dangerous content
+        for i, arg in enumerate(args):
+            # Check for file paths
+            if "/" in arg:
+                # Check if path is allowed
+                if (not any(arg.startswith(path) for path in self.allowed_paths)
+                        and violations.first("unauthorized_path", arg)):
+                    violations.append({
+                        "type": "unauthorized_path",
+                        "command": command,
+                        "description": f"Unauthorized path: {arg}",
+                        "severity": "medium"
+                    })
+                    if self.fail_fast:
+                        return violations
+            
+            # Check for suspicious arguments
+            if (any(pattern.search(arg) for pattern in self.compiled_patterns)
+                    and violations.first("dangerous_argument", arg)):
+                violations.append({
+                    "type": "dangerous_argument",
+                    "command": command,
+                    "description": f"Dangerous argument: {arg}",
+                    "severity": "high"
+                })
+                if self.fail_fast:
+                    return violations
+        
+        # Check for command chaining
+        if not self._metachars.isdisjoint(command):
+            violations.append({
+                "type": "command_chaining",
+                "command": command,
+                "description": "Command chaining detected",
+                "severity": "critical"
+            })
+            if self.fail_fast:
+                return violations
+        
+        # Check for environment variable manipulation
+        if _ENV_BRACE_RE.search(command) or _ENV_VAR_RE.search(command):
+            violations.append({
+                "type": "env_variable",
+                "command": command,
+                "description": "Environment variable usage detected",
+                "severity": "medium"
+            })
+            if self.fail_fast:
+                return violations
+        
+        # Check for redirection
+        if any(op in command for op in [">", ">>", "<", "<<", "2>", "2>>"]):
+            violations.append({
+                "type": "redirection",
+                "command": command,
+                "description": "I/O redirection detected",
+                "severity": "medium"
+            })
+            if self.fail_fast:
+                return violations
+        
+        return violations
+    
     def is_command_safe(self, command: str) -> bool:
         """
         Quick check if a command is safe.
@@ -274,10 +334,14 @@ class BashGuardHook:
             base_command = parts[0]
             
             # Quick checks
-            if base_command in self.blocked_commands:
+            if (base_command and self._blocked_firstbyte[ord(base_command[0]) & 0xFF]
+                    and base_command in self.blocked_commands):
                 return False
             
-            if self.allowed_commands and base_command not in self.allowed_commands:
+            if self.allowed_commands and not (
+                base_command and self._allowed_firstbyte[ord(base_command[0]) & 0xFF]
+                and base_command in self.allowed_commands
+            ):
                 return False
             
             # Check for dangerous patterns
@@ -286,7 +350,7 @@ class BashGuardHook:
                     return False
             
             # Check for command chaining
-            if any(char in command for char in [";", "&", "|", "`", "$"]):
+            if not self._metachars.isdisjoint(command):
                 return False
             
             return True
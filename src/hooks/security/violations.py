@@ -0,0 +1,41 @@
+"""
+Security Violation Helpers
+Module ID: APEX-HOOK-SEC-003
+Version: 0.1.0
+
+Shared violation bookkeeping for the security hooks.
+"""
+
+from typing import Any, Set, Tuple
+
+
+class ViolationList(list):
+    """
+    List of violations in payload form, one per (type, offence) pair.
+    
+    Checks call first() before building a violation, so a repeated offence
+    is dropped before its payload dict is allocated.
+    """
+    
+    def __init__(self):
+        """Initialize an empty violation list."""
+        super().__init__()
+        self._seen: Set[Tuple[str, Any]] = set()
+    
+    def first(self, violation_type: str, offence: Any) -> bool:
+        """
+        Record an offence and report whether it is new.
+        
+        Args:
+            violation_type: Violation type
+            offence: What identifies the offence, such as (line, name)
+                or the offending argument
+        
+        Returns:
+            True the first time the pair is seen, False afterwards
+        """
+        key = (violation_type, offence)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
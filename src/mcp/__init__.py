@@ -12,10 +12,10 @@ Git Hash: INITIAL
 
 from src.mcp.server import (
     MCPServer,
-    mcp_server,
+    get_mcp_server,
 )
 
 __all__ = [
     "MCPServer",
-    "mcp_server",
+    "get_mcp_server",
 ]
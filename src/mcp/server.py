@@ -8,16 +8,114 @@ capabilities for the APEX Agent Payroll System.
 """
 
 import asyncio
-import json
+from collections import OrderedDict
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
+import inspect
+import sys
+import time
+import types
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# asyncio.timeout and Task.uncancel are only available on Python 3.11+
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
+# dataclass(slots=True) needs Python 3.10+; 3.9 falls back to a __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Shared read-only params for requests that omit them
+_EMPTY_PARAMS = types.MappingProxyType({})
+
+# Sort key for executions that never started (sorts after all started ones)
+_NOT_STARTED_NS = -1
+
+
+_EXECUTION_ID_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "execution_id": {
+            "type": "string",
+            "description": "Execution ID"
+        }
+    },
+    "required": ["execution_id"]
+}
+
+# Built-in tools: (name, description, input_schema, handler method, async)
+# Schemas are built once at import and shared by every server instance
+_BUILTIN_TOOLS = (
+    (
+        "list_tools",
+        "List all available tools",
+        {
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "Filter by category"
+                }
+            }
+        },
+        "_handle_list_tools",
+        False,
+    ),
+    (
+        "get_tool_info",
+        "Get information about a specific tool",
+        {
+            "type": "object",
+            "properties": {
+                "tool_name": {
+                    "type": "string",
+                    "description": "Name of the tool"
+                }
+            },
+            "required": ["tool_name"]
+        },
+        "_handle_get_tool_info",
+        False,
+    ),
+    (
+        "execute_tool",
+        "Execute a tool",
+        {
+            "type": "object",
+            "properties": {
+                "tool_name": {
+                    "type": "string",
+                    "description": "Name of the tool to execute"
+                },
+                "arguments": {
+                    "type": "object",
+                    "description": "Arguments for the tool"
+                }
+            },
+            "required": ["tool_name"]
+        },
+        "_handle_execute_tool",
+        True,
+    ),
+    (
+        "get_execution_status",
+        "Get status of a tool execution",
+        _EXECUTION_ID_SCHEMA,
+        "_handle_get_execution_status",
+        False,
+    ),
+    (
+        "cancel_execution",
+        "Cancel a running tool execution",
+        _EXECUTION_ID_SCHEMA,
+        "_handle_cancel_execution",
+        False,
+    ),
+)
+
 
 class ToolStatus(Enum):
     """Tool execution status."""
@@ -28,7 +126,7 @@ class ToolStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Tool:
     """Represents an MCP tool."""
     name: str
@@ -40,7 +138,7 @@ class Tool:
     async_handler: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ToolExecution:
     """Represents a tool execution."""
     id: str
@@ -49,10 +147,59 @@ class ToolExecution:
     status: ToolStatus = ToolStatus.IDLE
     result: Optional[Any] = None
     error: Optional[str] = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    # time.monotonic_ns() readings, for duration, ordering and age checks
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
     duration: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Wall clock minus monotonic clock, read at this execution's first
+    # transition; turns the readings above into datetimes when reported
+    _epoch_offset_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # ISO strings cached on first read; timestamps are set once per execution
+    _started_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _completed_at_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def mark_started(self) -> None:
+        """Record the start time."""
+        self.started_at_ns = time.monotonic_ns()
+        self._epoch_offset_ns = time.time_ns() - self.started_at_ns
+    
+    def mark_completed(self) -> None:
+        """Record the completion time."""
+        self.completed_at_ns = time.monotonic_ns()
+        if self._epoch_offset_ns is None:
+            # Never started, e.g. the tool was not found
+            self._epoch_offset_ns = time.time_ns() - self.completed_at_ns
+    
+    def _to_datetime(self, timestamp_ns: Optional[int]) -> Optional[datetime]:
+        """Convert one of this execution's monotonic readings to a naive UTC datetime."""
+        if timestamp_ns is None:
+            return None
+        return datetime.utcfromtimestamp((timestamp_ns + self._epoch_offset_ns) / 1e9)
+    
+    @property
+    def started_at(self) -> Optional[datetime]:
+        """Start time as a UTC datetime."""
+        return self._to_datetime(self.started_at_ns)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Completion time as a UTC datetime."""
+        return self._to_datetime(self.completed_at_ns)
+    
+    @property
+    def started_at_iso(self) -> Optional[str]:
+        """Start time as an ISO 8601 string."""
+        if self._started_at_iso is None and self.started_at_ns is not None:
+            self._started_at_iso = self.started_at.isoformat()
+        return self._started_at_iso
+    
+    @property
+    def completed_at_iso(self) -> Optional[str]:
+        """Completion time as an ISO 8601 string."""
+        if self._completed_at_iso is None and self.completed_at_ns is not None:
+            self._completed_at_iso = self.completed_at.isoformat()
+        return self._completed_at_iso
 
 
 class ToolRegistry:
@@ -62,6 +209,11 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self._tools: Dict[str, Tool] = {}
         self._categories: Dict[str, List[str]] = {}
+        # Tool tuples per category (None = all tools), rebuilt after changes
+        self._list_cache: Dict[Optional[str], Tuple[Tool, ...]] = {}
+        # tools/list descriptors, built once per tool at registration
+        self._descriptors: Dict[str, Dict[str, Any]] = {}
+        self._descriptor_cache: Dict[Optional[str], Tuple[Dict[str, Any], ...]] = {}
         
         logger.info("ToolRegistry initialized")
     
@@ -80,6 +232,16 @@ class ToolRegistry:
         if tool.name not in self._categories[tool.category]:
             self._categories[tool.category].append(tool.name)
         
+        self._descriptors[tool.name] = {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": tool.input_schema,
+            "category": tool.category
+        }
+        
+        self._list_cache.clear()
+        self._descriptor_cache.clear()
+        
         logger.info(f"Registered tool: {tool.name} in category {tool.category}")
     
     def unregister_tool(self, name: str) -> bool:
@@ -92,17 +254,19 @@ class ToolRegistry:
         Returns:
             True if unregistered successfully
         """
-        if name not in self._tools:
+        # Remove tool
+        tool = self._tools.pop(name, None)
+        if tool is None:
             return False
-        
-        tool = self._tools[name]
+        del self._descriptors[name]
         
         # Remove from category
-        if tool.category in self._categories and name in self._categories[tool.category]:
-            self._categories[tool.category].remove(name)
+        category_tools = self._categories.get(tool.category)
+        if category_tools and name in category_tools:
+            category_tools.remove(name)
         
-        # Remove tool
-        del self._tools[name]
+        self._list_cache.clear()
+        self._descriptor_cache.clear()
         
         logger.info(f"Unregistered tool: {name}")
         return True
@@ -111,7 +275,7 @@ class ToolRegistry:
         """Get a tool by name."""
         return self._tools.get(name)
     
-    def list_tools(self, category: str = None) -> List[Tool]:
+    def list_tools(self, category: str = None) -> Tuple[Tool, ...]:
         """
         List tools, optionally filtered by category.
         
@@ -119,12 +283,37 @@ class ToolRegistry:
             category: Category filter
             
         Returns:
-            List of tools
+            Tuple of tools, cached until the next register/unregister
         """
-        if category:
-            tool_names = self._categories.get(category, [])
-            return [self._tools[name] for name in tool_names if name in self._tools]
-        return list(self._tools.values())
+        key = category or None
+        tools = self._list_cache.get(key)
+        if tools is None:
+            if key is None:
+                tools = tuple(self._tools.values())
+            else:
+                tool_names = self._categories.get(key, [])
+                tools = tuple(self._tools[name] for name in tool_names if name in self._tools)
+            self._list_cache[key] = tools
+        return tools
+    
+    def list_tool_descriptors(self, category: str = None) -> List[Dict[str, Any]]:
+        """
+        List tool descriptors, optionally filtered by category.
+        
+        The descriptor dicts are shared across calls and must not be mutated.
+        
+        Args:
+            category: Category filter
+            
+        Returns:
+            List of tool descriptors
+        """
+        key = category or None
+        descriptors = self._descriptor_cache.get(key)
+        if descriptors is None:
+            descriptors = tuple(self._descriptors[tool.name] for tool in self.list_tools(key))
+            self._descriptor_cache[key] = descriptors
+        return list(descriptors)
     
     def get_categories(self) -> List[str]:
         """Get all tool categories."""
@@ -139,137 +328,60 @@ class MCPServer:
     execution management, and protocol handling.
     """
     
-    def __init__(self, name: str = "apex-mcp-server", version: str = "0.1.0"):
+    def __init__(
+        self,
+        name: str = "apex-mcp-server",
+        version: str = "0.1.0",
+        max_executions: int = 10000
+    ):
         """
         Initialize the MCP server.
         
         Args:
             name: Server name
             version: Server version
+            max_executions: Maximum execution records kept; the oldest
+                are evicted once the limit is exceeded
         """
         self.name = name
         self.version = version
+        self.max_executions = max_executions
         self.tool_registry = ToolRegistry()
-        self._executions: Dict[str, ToolExecution] = {}
+        self._executions: Dict[str, ToolExecution] = OrderedDict()
         self._running_tasks: Dict[str, asyncio.Task] = {}
         
         # Register built-in tools
         self._register_builtin_tools()
         
+        # JSON-RPC method dispatch table
+        self._method_table: Dict[str, Callable] = {
+            "tools/list": self._handle_list_tools,
+            "tools/get": self._handle_get_tool_info,
+            "tools/call": self._handle_execute_tool,
+            "execution/status": self._handle_get_execution_status,
+            "execution/cancel": self._handle_cancel_execution,
+        }
+        
         logger.info(f"MCP Server initialized: {name} v{version}")
     
     def _register_builtin_tools(self) -> None:
         """Register built-in MCP tools."""
-        
-        # List tools tool
-        self.tool_registry.register_tool(Tool(
-            name="list_tools",
-            description="List all available tools",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Filter by category"
-                    }
-                }
-            },
-            handler=self._handle_list_tools,
-            category="system"
-        ))
-        
-        # Get tool info tool
-        self.tool_registry.register_tool(Tool(
-            name="get_tool_info",
-            description="Get information about a specific tool",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "tool_name": {
-                        "type": "string",
-                        "description": "Name of the tool"
-                    }
-                },
-                "required": ["tool_name"]
-            },
-            handler=self._handle_get_tool_info,
-            category="system"
-        ))
-        
-        # Execute tool tool
-        self.tool_registry.register_tool(Tool(
-            name="execute_tool",
-            description="Execute a tool",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "tool_name": {
-                        "type": "string",
-                        "description": "Name of the tool to execute"
-                    },
-                    "arguments": {
-                        "type": "object",
-                        "description": "Arguments for the tool"
-                    }
-                },
-                "required": ["tool_name"]
-            },
-            handler=self._handle_execute_tool,
-            category="system",
-            async_handler=True
-        ))
-        
-        # Get execution status tool
-        self.tool_registry.register_tool(Tool(
-            name="get_execution_status",
-            description="Get status of a tool execution",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "execution_id": {
-                        "type": "string",
-                        "description": "Execution ID"
-                    }
-                },
-                "required": ["execution_id"]
-            },
-            handler=self._handle_get_execution_status,
-            category="system"
-        ))
-        
-        # Cancel execution tool
-        self.tool_registry.register_tool(Tool(
-            name="cancel_execution",
-            description="Cancel a running tool execution",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "execution_id": {
-                        "type": "string",
-                        "description": "Execution ID"
-                    }
-                },
-                "required": ["execution_id"]
-            },
-            handler=self._handle_cancel_execution,
-            category="system"
-        ))
+        for name, description, input_schema, handler_name, async_handler in _BUILTIN_TOOLS:
+            self.tool_registry.register_tool(Tool(
+                name=name,
+                description=description,
+                input_schema=input_schema,
+                handler=getattr(self, handler_name),
+                category="system",
+                async_handler=async_handler
+            ))
     
     def _handle_list_tools(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle list_tools request."""
         category = arguments.get("category")
-        tools = self.tool_registry.list_tools(category)
         
         return {
-            "tools": [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.input_schema,
-                    "category": tool.category
-                }
-                for tool in tools
-            ],
+            "tools": self.tool_registry.list_tool_descriptors(category),
             "categories": self.tool_registry.get_categories()
         }
     
@@ -307,12 +419,16 @@ class MCPServer:
         
         self._executions[execution_id] = execution
         
+        # Evict the oldest records once over the limit
+        while len(self._executions) > self.max_executions:
+            self._executions.popitem(last=False)
+        
         # Get tool
         tool = self.tool_registry.get_tool(tool_name)
         if not tool:
             execution.status = ToolStatus.FAILED
             execution.error = f"Tool not found: {tool_name}"
-            execution.completed_at = datetime.utcnow()
+            execution.mark_completed()
             return {
                 "execution_id": execution_id,
                 "status": "failed",
@@ -322,37 +438,29 @@ class MCPServer:
         # Execute tool
         try:
             execution.status = ToolStatus.RUNNING
-            execution.started_at = datetime.utcnow()
+            execution.mark_started()
             
             if tool.async_handler:
-                # Async execution
-                task = asyncio.create_task(
-                    self._execute_tool_async(tool, tool_args, execution)
-                )
-                self._running_tasks[execution_id] = task
-                
                 # Wait for completion or timeout
                 try:
-                    await asyncio.wait_for(task, timeout=tool.timeout)
+                    await self._run_async_tool(execution_id, tool, tool_args, execution)
                 except asyncio.TimeoutError:
-                    task.cancel()
                     execution.status = ToolStatus.FAILED
                     execution.error = f"Tool execution timed out after {tool.timeout}s"
-                    execution.completed_at = datetime.utcnow()
+                    execution.mark_completed()
             else:
                 # Sync execution
                 result = tool.handler(tool_args)
                 execution.result = result
                 execution.status = ToolStatus.COMPLETED
-                execution.completed_at = datetime.utcnow()
+                execution.mark_completed()
             
             # Calculate duration
-            if execution.started_at and execution.completed_at:
-                execution.duration = (execution.completed_at - execution.started_at).total_seconds()
+            if execution.started_at_ns is not None and execution.completed_at_ns is not None:
+                execution.duration = (execution.completed_at_ns - execution.started_at_ns) / 1e9
             
             # Clean up
-            if execution_id in self._running_tasks:
-                del self._running_tasks[execution_id]
+            self._running_tasks.pop(execution_id, None)
             
             return {
                 "execution_id": execution_id,
@@ -365,11 +473,10 @@ class MCPServer:
         except Exception as e:
             execution.status = ToolStatus.FAILED
             execution.error = str(e)
-            execution.completed_at = datetime.utcnow()
+            execution.mark_completed()
             
             # Clean up
-            if execution_id in self._running_tasks:
-                del self._running_tasks[execution_id]
+            self._running_tasks.pop(execution_id, None)
             
             return {
                 "execution_id": execution_id,
@@ -377,6 +484,44 @@ class MCPServer:
                 "error": execution.error
             }
     
+    async def _run_async_tool(
+        self,
+        execution_id: str,
+        tool: Tool,
+        arguments: Dict[str, Any],
+        execution: ToolExecution
+    ) -> None:
+        """
+        Run an async tool under its timeout, tracked for cancel_execution.
+        
+        On Python 3.11+ the tool runs inline in the current task under
+        asyncio.timeout; older versions run it in its own task under
+        asyncio.wait_for.
+        
+        Raises:
+            asyncio.TimeoutError: If the tool exceeds its timeout
+        """
+        if _HAS_ASYNCIO_TIMEOUT:
+            task = asyncio.current_task()
+            self._running_tasks[execution_id] = task
+            try:
+                async with asyncio.timeout(tool.timeout):
+                    await self._execute_tool_async(tool, arguments, execution)
+            except asyncio.CancelledError:
+                # Only swallow cancellations requested via cancel_execution
+                if execution.status is not ToolStatus.CANCELLED:
+                    raise
+                task.uncancel()
+        else:
+            task = asyncio.create_task(self._execute_tool_async(tool, arguments, execution))
+            self._running_tasks[execution_id] = task
+            try:
+                await asyncio.wait_for(task, timeout=tool.timeout)
+            except asyncio.CancelledError:
+                # Only swallow cancellations requested via cancel_execution
+                if execution.status is not ToolStatus.CANCELLED:
+                    raise
+    
     async def _execute_tool_async(
         self,
         tool: Tool,
@@ -388,11 +533,11 @@ class MCPServer:
             result = await tool.handler(arguments)
             execution.result = result
             execution.status = ToolStatus.COMPLETED
-            execution.completed_at = datetime.utcnow()
+            execution.mark_completed()
         except Exception as e:
             execution.status = ToolStatus.FAILED
             execution.error = str(e)
-            execution.completed_at = datetime.utcnow()
+            execution.mark_completed()
     
     def _handle_get_execution_status(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle get_execution_status request."""
@@ -410,8 +555,8 @@ class MCPServer:
             "status": execution.status.value,
             "result": execution.result,
             "error": execution.error,
-            "started_at": execution.started_at.isoformat() if execution.started_at else None,
-            "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
+            "started_at": execution.started_at_iso,
+            "completed_at": execution.completed_at_iso,
             "duration": execution.duration
         }
     
@@ -431,23 +576,46 @@ class MCPServer:
             }
         
         # Cancel task if running
-        if execution_id in self._running_tasks:
-            task = self._running_tasks[execution_id]
+        task = self._running_tasks.pop(execution_id, None)
+        if task is not None:
             task.cancel()
-            del self._running_tasks[execution_id]
         
         # Update execution
         execution.status = ToolStatus.CANCELLED
-        execution.completed_at = datetime.utcnow()
+        execution.mark_completed()
         
         return {
             "execution_id": execution_id,
             "status": "cancelled"
         }
     
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_request(self, request: Any) -> Any:
         """
-        Handle an MCP request.
+        Handle an MCP request or a batch of requests.
+        
+        A batch is a list of request dicts; its sub-requests are dispatched
+        concurrently and their responses returned in the same order.
+        
+        Args:
+            request: MCP request, or list of MCP requests
+            
+        Returns:
+            MCP response, or list of responses for a batch
+        """
+        if isinstance(request, list):
+            if not request:
+                return {
+                    "error": "Empty batch"
+                }
+            return list(await asyncio.gather(
+                *[self._dispatch_request(item) for item in request]
+            ))
+        
+        return await self._dispatch_request(request)
+    
+    async def _dispatch_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch a single MCP request through the method table.
         
         Args:
             request: MCP request
@@ -457,22 +625,17 @@ class MCPServer:
         """
         try:
             method = request.get("method")
-            params = request.get("params", {})
+            handler = self._method_table.get(method)
             
-            if method == "tools/list":
-                return self._handle_list_tools(params)
-            elif method == "tools/get":
-                return self._handle_get_tool_info(params)
-            elif method == "tools/call":
-                return await self._handle_execute_tool(params)
-            elif method == "execution/status":
-                return self._handle_get_execution_status(params)
-            elif method == "execution/cancel":
-                return self._handle_cancel_execution(params)
-            else:
+            if handler is None:
                 return {
                     "error": f"Unknown method: {method}"
                 }
+            
+            result = handler(request.get("params") or _EMPTY_PARAMS)
+            if inspect.iscoroutine(result):
+                result = await result
+            return result
                 
         except Exception as e:
             logger.error(f"Error handling MCP request: {str(e)}")
@@ -490,13 +653,17 @@ class MCPServer:
         Returns:
             List of executions
         """
-        executions = list(self._executions.values())
-        
+        # Filter before sorting so only matching executions are ordered
         if status:
-            executions = [e for e in executions if e.status == status]
+            executions = [e for e in self._executions.values() if e.status is status]
+        else:
+            executions = list(self._executions.values())
         
         # Sort by start time (newest first)
-        executions.sort(key=lambda e: e.started_at or datetime.min, reverse=True)
+        executions.sort(
+            key=lambda e: e.started_at_ns if e.started_at_ns is not None else _NOT_STARTED_NS,
+            reverse=True
+        )
         
         return executions
     
@@ -510,22 +677,35 @@ class MCPServer:
         Returns:
             Number of executions cleaned up
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        
-        to_remove = [
-            execution_id for execution_id, execution in self._executions.items()
-            if execution.started_at and execution.started_at < cutoff_time
-        ]
+        cutoff_ns = time.monotonic_ns() - int(max_age_hours * 3600 * 1_000_000_000)
+        
+        # Executions are inserted in start order, so the scan can stop at the
+        # first one newer than the cutoff instead of walking the whole dict
+        to_remove = []
+        for execution_id, execution in self._executions.items():
+            if execution.started_at_ns is None:
+                continue
+            if execution.started_at_ns >= cutoff_ns:
+                break
+            to_remove.append(execution_id)
         
         for execution_id in to_remove:
             del self._executions[execution_id]
-            if execution_id in self._running_tasks:
-                self._running_tasks[execution_id].cancel()
-                del self._running_tasks[execution_id]
+            task = self._running_tasks.pop(execution_id, None)
+            if task is not None:
+                task.cancel()
         
         logger.info(f"Cleaned up {len(to_remove)} old executions")
         return len(to_remove)
 
 
 # Global MCP server instance
-mcp_server = MCPServer()
+_mcp_server: Optional[MCPServer] = None
+
+
+def get_mcp_server() -> MCPServer:
+    """Get or create global MCP server."""
+    global _mcp_server
+    if _mcp_server is None:
+        _mcp_server = MCPServer()
+    return _mcp_server
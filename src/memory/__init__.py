@@ -20,18 +20,40 @@ Git Hash: INITIAL
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import logging
 import uuid
 
+import numpy as np
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
 from src.core.constants import (
     VECTOR_STORE_BACKEND,
     VECTOR_EMBEDDING_MODEL,
     VECTOR_DIMENSION,
+    HNSW_M,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
     SEMANTIC_UTILITY_THRESHOLD,
     CHUNK_SIZE_TOKENS,
     CHUNK_OVERLAP_TOKENS,
     TEMP_DIR,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: np.ndarray) -> float:
+    """L2-normalize a float32 vector in place and return its original norm."""
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return norm
+
 
 @dataclass
 class MemoryChunk:
@@ -83,7 +105,6 @@ class SemanticSieve:
         Note: This is a simplistic implementation using character counts.
         In production, use token-aware splitting with a tokenizer.
         """
-        chunks = []
         text_len = len(text)
         
         if text_len <= chunk_size:
@@ -92,26 +113,52 @@ class SemanticSieve:
         # Approximate tokens to characters (rough estimate: 4 chars per token)
         char_chunk_size = chunk_size * 4
         char_overlap = overlap * 4
+        stride = char_chunk_size - char_overlap
+        if stride <= 0:
+            raise ValueError("overlap must be smaller than chunk_size")
         
-        start = 0
-        while start < text_len:
-            end = min(start + char_chunk_size, text_len)
-            chunks.append(text[start:end])
-            start = end - char_overlap
+        # Precompute every boundary at once; the last chunk is the first
+        # one whose end reaches the end of the text.
+        count = max(1, -(-(text_len - char_overlap) // stride))
+        starts = np.arange(count, dtype=np.int64) * stride
+        ends = np.minimum(starts + char_chunk_size, text_len)
         
-        return chunks
+        return [text[s:e] for s, e in zip(starts.tolist(), ends.tolist())]
 
 
 class VectorStore:
     """
     Abstract interface for vector store backends (ChromaDB, FAISS).
     Implements HNSW graph topology for fast similarity search.
+    
+    Embeddings are kept L2-normalized in a float32 matrix so a search is
+    a single matrix-vector product over all stored rows. With the "faiss"
+    backend, a FAISS HNSW graph proposes candidate rows instead and only
+    those are scored against the matrix.
     """
 
+    # Initial row capacity of the embedding matrix; doubles when full
+    INITIAL_CAPACITY = 64
+
     def __init__(self, backend: str = VECTOR_STORE_BACKEND):
         """Initialize vector store."""
         self.backend = backend
         self.memories: Dict[str, MemoryChunk] = {}
+        
+        # Columns indexed by row: embedding matrix, active flag and chunk;
+        # rows [0, _size) are in use
+        self._matrix: Optional[np.ndarray] = None
+        self._active_mask: Optional[np.ndarray] = None
+        self._chunks: List[MemoryChunk] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        
+        # HNSW graph over the matrix rows; graph label i refers to row _hnsw_rows[i]
+        self._use_hnsw = backend == "faiss" and FAISS_AVAILABLE
+        if backend == "faiss" and not FAISS_AVAILABLE:
+            logger.warning("FAISS not available, using exact search. Install with: pip install faiss-cpu")
+        self._hnsw = None
+        self._hnsw_rows: List[int] = []
 
     async def add_memory(self, chunk: MemoryChunk) -> str:
         """
@@ -127,8 +174,64 @@ class VectorStore:
             chunk.id = str(uuid.uuid4())
         
         self.memories[chunk.id] = chunk
+        self._index_vector(chunk)
         return chunk.id
 
+    def _index_vector(self, chunk: MemoryChunk) -> None:
+        """
+        Store a chunk's normalized embedding in the search matrix.
+        
+        Chunks without a vector, or whose vector does not match the matrix
+        dimension, are kept out of search results.
+        """
+        row = self._rows.get(chunk.id)
+        if row is not None:
+            self._chunks[row] = chunk
+        
+        vector = None
+        if chunk.vector:
+            vector = np.array(chunk.vector, dtype=np.float32)
+            if self._matrix is not None and vector.shape[0] != self._matrix.shape[1]:
+                vector = None
+        
+        if vector is None:
+            if row is not None:
+                self._active_mask[row] = False
+            return
+        
+        if row is None:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.INITIAL_CAPACITY, vector.shape[0]), dtype=np.float32)
+                self._active_mask = np.zeros(self.INITIAL_CAPACITY, dtype=bool)
+            elif self._size == self._matrix.shape[0]:
+                # Grow geometrically so appends stay amortized O(d)
+                capacity = self._matrix.shape[0] * 2
+                matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+                matrix[:self._size] = self._matrix
+                mask = np.zeros(capacity, dtype=bool)
+                mask[:self._size] = self._active_mask
+                self._matrix = matrix
+                self._active_mask = mask
+            
+            row = self._size
+            self._size += 1
+            self._chunks.append(chunk)
+            self._rows[chunk.id] = row
+        
+        _normalize(vector)
+        self._matrix[row] = vector
+        self._active_mask[row] = chunk.status == "active"
+        
+        if self._use_hnsw:
+            if self._hnsw is None:
+                self._hnsw = faiss.IndexHNSWFlat(vector.shape[0], HNSW_M, faiss.METRIC_INNER_PRODUCT)
+                self._hnsw.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+                self._hnsw.hnsw.efSearch = HNSW_EF_SEARCH
+            # HNSW cannot update in place; a re-added id gets a new node and
+            # its stale node is rescored against the current row at search time
+            self._hnsw.add(vector[None, :])
+            self._hnsw_rows.append(row)
+
     async def search(self, query_vector: List[float], top_k: int = 5,
                      min_similarity: float = 0.82) -> List[MemoryChunk]:
         """
@@ -142,37 +245,53 @@ class VectorStore:
         Returns:
             List of top-K similar memory chunks
         """
-        if not self.memories:
+        if self._size == 0 or top_k <= 0:
             return []
         
-        # This is a stub. In production, use HNSW algorithms for O(log N) search
-        # For now, brute force similarity
-        results = []
-        for memory in self.memories.values():
-            if memory.status != "active":
-                continue
-            
-            if memory.vector:
-                similarity = self._cosine_similarity(query_vector, memory.vector)
-                if similarity >= min_similarity:
-                    results.append((memory, similarity))
+        # Normalize the query once; cosine then reduces to a dot product
+        query = np.array(query_vector, dtype=np.float32)
+        if query.shape != (self._matrix.shape[1],) or _normalize(query) == 0:
+            return []
         
-        results.sort(key=lambda x: x[1], reverse=True)
-        return [m for m, _ in results[:top_k]]
-
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if len(vec1) != len(vec2):
-            return 0.0
+        if self._hnsw is not None:
+            rows = self._hnsw_candidates(query, top_k)
+            vectors = self._matrix[rows]
+        else:
+            rows = np.arange(self._size)
+            vectors = self._matrix[:self._size]
         
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = sum(a ** 2 for a in vec1) ** 0.5
-        magnitude2 = sum(b ** 2 for b in vec2) ** 0.5
+        # Rows are unit-norm, so one matrix-vector product yields every cosine
+        scores = vectors @ query
         
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
+        # Apply the threshold and active mask first so only survivors are ranked
+        top = np.flatnonzero((scores >= min_similarity) & self._active_mask[rows])
+        if len(top) > top_k:
+            # Partition out the top-k without sorting every survivor
+            top = np.sort(top[np.argpartition(-scores[top], top_k - 1)[:top_k]])
+        # Stable sort over row order keeps insertion order among equal scores
+        top = top[np.argsort(-scores[top], kind="stable")]
         
-        return dot_product / (magnitude1 * magnitude2)
+        chunks = self._chunks
+        return [chunks[i] for i in rows[top].tolist()]
+
+    def _hnsw_candidates(self, query: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Get candidate matrix rows for a query from the HNSW graph.
+        
+        Over-fetches so deprecated rows and stale nodes of re-added ids
+        still leave enough candidates after masking.
+        
+        Args:
+            query: Normalized query vector
+            top_k: Number of results requested
+            
+        Returns:
+            Sorted array of unique candidate row indices
+        """
+        n = min(self._hnsw.ntotal, max(top_k * 4, HNSW_EF_SEARCH))
+        _, labels = self._hnsw.search(query[None, :], n)
+        hnsw_rows = self._hnsw_rows
+        return np.unique([hnsw_rows[label] for label in labels[0].tolist() if label >= 0])
 
     async def deprecate_memory(self, memory_id: str, superseded_by: str) -> None:
         """
@@ -182,9 +301,14 @@ class VectorStore:
             memory_id: ID of deprecated memory
             superseded_by: ID of new memory that replaces it
         """
-        if memory_id in self.memories:
-            self.memories[memory_id].status = "deprecated"
-            self.memories[memory_id].superseded_by = superseded_by
+        memory = self.memories.get(memory_id)
+        if memory is not None:
+            memory.status = "deprecated"
+            memory.superseded_by = superseded_by
+            
+            row = self._rows.get(memory_id)
+            if row is not None:
+                self._active_mask[row] = False
 
 
 class ContextManager:
@@ -219,6 +343,8 @@ class ContextManager:
         if current_token_count <= self.max_context_tokens:
             return self.context_history
         
+        # Collected in visiting order and reversed once at the end, which
+        # yields the same order as prepending each kept turn
         pruned = []
         tokens_remaining = self.max_context_tokens
         
@@ -226,7 +352,7 @@ class ContextManager:
         for turn in self.context_history[-3:]:
             turn_tokens = turn.get("token_count", 0)
             if tokens_remaining >= turn_tokens:
-                pruned.insert(0, turn)
+                pruned.append(turn)
                 tokens_remaining -= turn_tokens
         
         # For older turns, apply retention scoring
@@ -241,9 +367,10 @@ class ContextManager:
             retention_score = (salience * recency) / max(token_cost, 1)
             
             if retention_score > 0.5 and tokens_remaining >= token_cost:
-                pruned.insert(0, turn)
+                pruned.append(turn)
                 tokens_remaining -= token_cost
         
+        pruned.reverse()
         return pruned
 
 
@@ -11,6 +11,8 @@ import asyncio
 import json
 import gzip
 import hashlib
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field, asdict
@@ -18,6 +20,19 @@ from enum import Enum
 from pathlib import Path
 import logging
 
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    logging.warning("zstandard not available, archival compression falls back to gzip. Install with: pip install zstandard")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +47,7 @@ class ArchivalStatus(Enum):
 class CompressionType(Enum):
     """Compression types for archival."""
     GZIP = "gzip"
+    ZSTD = "zstd"
     NONE = "none"
 
 
@@ -59,7 +75,8 @@ class ArchivalConfig:
     """Configuration for archival storage."""
     base_path: str = "./archival_storage"
     compression_enabled: bool = True
-    compression_type: CompressionType = CompressionType.GZIP
+    compression_type: CompressionType = CompressionType.ZSTD if ZSTD_AVAILABLE else CompressionType.GZIP
+    compression_level: int = 3  # zstd level
     auto_archive_days: int = 30
     auto_delete_days: int = 365
     max_storage_gb: float = 100.0
@@ -67,6 +84,96 @@ class ArchivalConfig:
     index_enabled: bool = True
 
 
+def _parse_enum(enum_cls, value):
+    """Parse an enum from its value, also accepting the legacy "Class.MEMBER" form."""
+    if isinstance(value, enum_cls):
+        return value
+    prefix = enum_cls.__name__ + "."
+    if value.startswith(prefix):
+        return enum_cls[value[len(prefix):]]
+    return enum_cls(value)
+
+
+def _metadata_to_dict(metadata: ArchivalMetadata) -> Dict[str, Any]:
+    """Convert metadata to a JSON-ready dict (datetimes still need default=str)."""
+    data = asdict(metadata)
+    data['status'] = metadata.status.value
+    data['compression_type'] = metadata.compression_type.value
+    return data
+
+
+def _metadata_from_dict(data: Dict[str, Any]) -> ArchivalMetadata:
+    """Rebuild metadata from a dict produced by _metadata_to_dict."""
+    data = dict(data)
+    
+    # Convert datetime strings
+    data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+    if data.get('last_accessed'):
+        data['last_accessed'] = datetime.fromisoformat(data['last_accessed'])
+    if data.get('expires_at'):
+        data['expires_at'] = datetime.fromisoformat(data['expires_at'])
+    
+    data['status'] = _parse_enum(ArchivalStatus, data['status'])
+    data['compression_type'] = _parse_enum(CompressionType, data['compression_type'])
+    return ArchivalMetadata(**data)
+
+
+def _dumps_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize a metadata or index log record to JSON.
+    
+    Uses orjson when available; datetimes are passed through to str() so
+    the output matches the stdlib encoder's and either can read it back.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode('utf-8')
+    return json.dumps(record, default=str)
+
+
+def _loads_record(text: Union[str, bytes]) -> Any:
+    """Parse a metadata or index log record, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _append_text(path: Path, text: str) -> None:
+    """Append to a text file; run via asyncio.to_thread to keep disk I/O off the loop."""
+    with open(path, 'a') as f:
+        f.write(text)
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write a text file; run via asyncio.to_thread to keep disk I/O off the loop."""
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+class _HashingWriter:
+    """File wrapper that counts and optionally hashes bytes as they are written."""
+    
+    def __init__(self, f, checksum_enabled: bool):
+        """Wrap a binary file opened for writing."""
+        self._f = f
+        self._hash = hashlib.sha256() if checksum_enabled else None
+        self.size = 0
+    
+    def write(self, data) -> int:
+        """Write data through to the file."""
+        if self._hash is not None:
+            self._hash.update(data)
+        self.size += len(data)
+        return self._f.write(data)
+    
+    def flush(self) -> None:
+        """Flush the underlying file."""
+        self._f.flush()
+    
+    def hexdigest(self) -> str:
+        """SHA-256 of everything written, or "" when checksums are disabled."""
+        return self._hash.hexdigest() if self._hash is not None else ""
+
+
 class ArchivalStorage:
     """
     L3 archival storage backend for long-term memory retention.
@@ -75,6 +182,9 @@ class ArchivalStorage:
     memory items with retention policies and automatic cleanup.
     """
     
+    # Minimum live-item count used for the index log compaction threshold
+    INDEX_LOG_MIN_COMPACT_LINES = 1000
+    
     def __init__(self, config: ArchivalConfig = None):
         """
         Initialize archival storage.
@@ -93,7 +203,16 @@ class ArchivalStorage:
         
         # In-memory index for fast lookups
         self._index: Dict[str, ArchivalMetadata] = {}
-        self._tag_index: Dict[str, List[str]] = {}
+        # Tag -> ids carrying it, as an insertion-ordered set
+        self._tag_index: Dict[str, Dict[str, None]] = {}
+        
+        # Append-only index log; every change appends a record and the
+        # log is compacted to one record per live item when it grows
+        self._index_log_path = self.base_path / "index" / "archival_index.ndjson"
+        self._index_log_lines = 0
+        # Created on first use, since an asyncio.Lock is tied to one event loop
+        self._index_log_lock: Optional[asyncio.Lock] = None
+        self._index_log_lock_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Load existing index
         if self.config.index_enabled:
@@ -130,23 +249,19 @@ class ArchivalStorage:
             json_data = json.dumps(data, default=str)
             data_bytes = json_data.encode('utf-8')
             
-            # Compress if enabled
+            # Select compression
             if self.config.compression_enabled:
-                compressed_bytes = gzip.compress(data_bytes)
                 compression_type = self.config.compression_type
+                if compression_type == CompressionType.ZSTD and not ZSTD_AVAILABLE:
+                    compression_type = CompressionType.GZIP
             else:
-                compressed_bytes = data_bytes
                 compression_type = CompressionType.NONE
             
-            # Calculate checksum
-            checksum = ""
-            if self.config.checksum_enabled:
-                checksum = hashlib.sha256(compressed_bytes).hexdigest()
-            
-            # Write data file
+            # Compress straight into the data file, hashing as it is written
             data_path = self.base_path / "data" / f"{archival_id}.dat"
-            with open(data_path, 'wb') as f:
-                f.write(compressed_bytes)
+            compressed_size, checksum = await asyncio.to_thread(
+                self._write_data_file, data_path, data_bytes, compression_type
+            )
             
             # Create metadata
             metadata = ArchivalMetadata(
@@ -156,7 +271,7 @@ class ArchivalStorage:
                 status=ArchivalStatus.ARCHIVED,
                 compression_type=compression_type,
                 size_bytes=len(data_bytes),
-                compressed_size_bytes=len(compressed_bytes),
+                compressed_size_bytes=compressed_size,
                 checksum=checksum,
                 tags=tags or [],
                 retention_policy=retention_policy,
@@ -165,12 +280,15 @@ class ArchivalStorage:
             
             # Write metadata file
             metadata_path = self.base_path / "metadata" / f"{archival_id}.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(asdict(metadata), f, default=str)
+            metadata_dict = _metadata_to_dict(metadata)
+            await asyncio.to_thread(
+                _write_text, metadata_path, _dumps_record(metadata_dict)
+            )
             
             # Update index
             if self.config.index_enabled:
                 self._update_index(metadata)
+                await self._append_index_log({"op": "put", "meta": metadata_dict})
             
             logger.info(f"Archived item: {item_id} -> {archival_id}")
             return archival_id
@@ -200,22 +318,16 @@ class ArchivalStorage:
                 logger.warning(f"Archived item {archival_id} has expired")
                 return None
             
-            # Read data file
+            # Read data file, decompressing and parsing JSON off the event loop
             data_path = self.base_path / "data" / f"{archival_id}.dat"
-            if not data_path.exists():
+            try:
+                data = await asyncio.to_thread(
+                    self._read_data_file, data_path, metadata.compression_type
+                )
+            except FileNotFoundError:
                 logger.error(f"Data file not found for {archival_id}")
                 return None
             
-            with open(data_path, 'rb') as f:
-                data_bytes = f.read()
-            
-            # Decompress if needed
-            if metadata.compression_type == CompressionType.GZIP:
-                data_bytes = gzip.decompress(data_bytes)
-            
-            # Parse JSON
-            data = json.loads(data_bytes.decode('utf-8'))
-            
             # Update access metadata
             metadata.access_count += 1
             metadata.last_accessed = datetime.utcnow()
@@ -251,15 +363,22 @@ class ArchivalStorage:
         """
         try:
             results = []
+            now = datetime.utcnow()
+            
+            # With tags, only items carrying one of them are candidates
+            if tags:
+                candidates = self._tag_candidates(tags)
+            else:
+                candidates = self._index.values()
             
             # Search through index
-            for metadata in self._index.values():
+            for metadata in candidates:
                 # Skip deleted items
                 if metadata.status == ArchivalStatus.DELETED:
                     continue
                 
                 # Check expiration
-                if metadata.expires_at and datetime.utcnow() > metadata.expires_at:
+                if metadata.expires_at and now > metadata.expires_at:
                     continue
                 
                 # Filter by tags
@@ -284,6 +403,30 @@ class ArchivalStorage:
             logger.error(f"Failed to search archived items: {str(e)}")
             return []
     
+    def _tag_candidates(self, tags: List[str]) -> List[ArchivalMetadata]:
+        """
+        Get indexed items carrying any of the given tags.
+        
+        Args:
+            tags: Tags to match
+            
+        Returns:
+            Matching items in archival order
+        """
+        if len(tags) == 1:
+            ids = self._tag_index.get(tags[0], {})
+        else:
+            ids = {}
+            for tag in tags:
+                ids.update(self._tag_index.get(tag, {}))
+        
+        index = self._index
+        candidates = [index[aid] for aid in ids if aid in index]
+        if len(tags) > 1:
+            # Each tag set is in archival order; restore it across the union
+            candidates.sort(key=lambda metadata: metadata.timestamp)
+        return candidates
+    
     async def delete(self, archival_id: str) -> bool:
         """
         Delete an archived item.
@@ -302,8 +445,7 @@ class ArchivalStorage:
             
             # Delete data file
             data_path = self.base_path / "data" / f"{archival_id}.dat"
-            if data_path.exists():
-                data_path.unlink()
+            await asyncio.to_thread(data_path.unlink, missing_ok=True)
             
             # Update metadata status
             metadata.status = ArchivalStatus.DELETED
@@ -312,6 +454,12 @@ class ArchivalStorage:
             # Update index
             if archival_id in self._index:
                 del self._index[archival_id]
+            for tag in metadata.tags:
+                tag_ids = self._tag_index.get(tag)
+                if tag_ids is not None:
+                    tag_ids.pop(archival_id, None)
+            if self.config.index_enabled:
+                await self._append_index_log({"op": "del", "id": archival_id})
             
             logger.info(f"Deleted archived item: {archival_id}")
             return True
@@ -331,10 +479,14 @@ class ArchivalStorage:
             expired_count = 0
             now = datetime.utcnow()
             
-            for archival_id, metadata in list(self._index.items()):
-                if metadata.expires_at and now > metadata.expires_at:
-                    if await self.delete(archival_id):
-                        expired_count += 1
+            expired_ids = [
+                archival_id for archival_id, metadata in self._index.items()
+                if metadata.expires_at and now > metadata.expires_at
+            ]
+            
+            for archival_id in expired_ids:
+                if await self.delete(archival_id):
+                    expired_count += 1
             
             logger.info(f"Cleaned up {expired_count} expired items")
             return expired_count
@@ -375,36 +527,79 @@ class ArchivalStorage:
             logger.error(f"Failed to get storage stats: {str(e)}")
             return {}
     
+    def _write_data_file(
+        self,
+        data_path: Path,
+        data_bytes: bytes,
+        compression_type: CompressionType
+    ) -> Tuple[int, str]:
+        """
+        Compress data into a data file in a single streaming pass.
+        
+        Args:
+            data_path: Data file path
+            data_bytes: Uncompressed data
+            compression_type: Compression to apply
+            
+        Returns:
+            Tuple of (bytes written, SHA-256 of the written bytes or "")
+        """
+        with open(data_path, 'wb') as f:
+            writer = _HashingWriter(f, self.config.checksum_enabled)
+            if compression_type == CompressionType.ZSTD:
+                cctx = zstd.ZstdCompressor(level=self.config.compression_level)
+                with cctx.stream_writer(writer, size=len(data_bytes), closefd=False) as compressor:
+                    compressor.write(data_bytes)
+            elif compression_type == CompressionType.GZIP:
+                with gzip.GzipFile(fileobj=writer, mode='wb') as compressor:
+                    compressor.write(data_bytes)
+            else:
+                writer.write(data_bytes)
+        
+        return writer.size, writer.hexdigest()
+    
+    def _read_data_file(self, data_path: Path, compression_type: CompressionType) -> Any:
+        """
+        Decompress and parse a data file in a single streaming pass.
+        
+        Args:
+            data_path: Data file path
+            compression_type: Compression the file was written with
+            
+        Returns:
+            Parsed JSON data
+        """
+        with open(data_path, 'rb') as f:
+            if compression_type == CompressionType.ZSTD:
+                with zstd.ZstdDecompressor().stream_reader(f) as reader:
+                    return json.load(reader)
+            if compression_type == CompressionType.GZIP:
+                with gzip.GzipFile(fileobj=f, mode='rb') as reader:
+                    return json.load(reader)
+            return json.load(f)
+    
     def _generate_archival_id(self, item_id: str) -> str:
         """Generate a unique archival ID."""
-        timestamp = datetime.utcnow().isoformat()
-        hash_input = f"{item_id}{timestamp}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        # Same 32 hex characters as before, keyed on the raw nanosecond clock
+        timestamp = time.time_ns().to_bytes(8, 'little')
+        return hashlib.blake2b(item_id.encode() + timestamp, digest_size=16).hexdigest()
     
     def _get_metadata(self, archival_id: str) -> Optional[ArchivalMetadata]:
         """Get metadata for an archival item."""
-        # Try index first
-        if archival_id in self._index:
-            return self._index[archival_id]
+        # The index holds every live item once loaded, so it is authoritative
+        if self.config.index_enabled:
+            return self._index.get(archival_id)
         
-        # Load from file
+        # Without an index, load from file
         metadata_path = self.base_path / "metadata" / f"{archival_id}.json"
         if not metadata_path.exists():
             return None
         
         try:
             with open(metadata_path, 'r') as f:
-                data = json.load(f)
+                data = _loads_record(f.read())
             
-            # Convert datetime strings
-            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-            if data.get('last_accessed'):
-                data['last_accessed'] = datetime.fromisoformat(data['last_accessed'])
-            if data.get('expires_at'):
-                data['expires_at'] = datetime.fromisoformat(data['expires_at'])
-            
-            metadata = ArchivalMetadata(**data)
-            return metadata
+            return _metadata_from_dict(data)
             
         except Exception as e:
             logger.error(f"Failed to load metadata for {archival_id}: {str(e)}")
@@ -414,43 +609,61 @@ class ArchivalStorage:
         """Update metadata for an archival item."""
         try:
             metadata_path = self.base_path / "metadata" / f"{metadata.id}.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(asdict(metadata), f, default=str)
+            metadata_dict = _metadata_to_dict(metadata)
+            await asyncio.to_thread(
+                _write_text, metadata_path, _dumps_record(metadata_dict)
+            )
             
             # Update index
             if self.config.index_enabled:
                 self._update_index(metadata)
+                await self._append_index_log({"op": "put", "meta": metadata_dict})
                 
         except Exception as e:
             logger.error(f"Failed to update metadata for {metadata.id}: {str(e)}")
     
     def _load_index(self) -> None:
-        """Load the archival index from disk."""
+        """Load the archival index from disk by replaying the index log."""
         try:
-            index_path = self.base_path / "index" / "archival_index.json"
-            if not index_path.exists():
-                return
-            
-            with open(index_path, 'r') as f:
-                index_data = json.load(f)
-            
-            for item_data in index_data:
-                # Convert datetime strings
-                item_data['timestamp'] = datetime.fromisoformat(item_data['timestamp'])
-                if item_data.get('last_accessed'):
-                    item_data['last_accessed'] = datetime.fromisoformat(item_data['last_accessed'])
-                if item_data.get('expires_at'):
-                    item_data['expires_at'] = datetime.fromisoformat(item_data['expires_at'])
+            if self._index_log_path.exists():
+                corrupt = False
+                with open(self._index_log_path, 'r') as f:
+                    for line_number, line in enumerate(f, 1):
+                        self._index_log_lines += 1
+                        try:
+                            record = _loads_record(line)
+                        except json.JSONDecodeError:
+                            # A torn final write from a crash; later records are still applied
+                            logger.warning(f"Skipping corrupt archival index log line {line_number}")
+                            corrupt = True
+                            continue
+                        
+                        if record["op"] == "put":
+                            metadata = _metadata_from_dict(record["meta"])
+                            self._index[metadata.id] = metadata
+                        elif record["op"] == "del":
+                            self._index.pop(record["id"], None)
                 
-                metadata = ArchivalMetadata(**item_data)
-                self._index[metadata.id] = metadata
+                # Rewrite a damaged log so new records do not append to a torn line
+                if corrupt:
+                    self._write_index_snapshot(self._index_snapshot_text())
+            else:
+                # Migrate a legacy full-snapshot index into the log format
+                legacy_path = self.base_path / "index" / "archival_index.json"
+                if not legacy_path.exists():
+                    return
                 
-                # Update tag index
-                for tag in metadata.tags:
-                    if tag not in self._tag_index:
-                        self._tag_index[tag] = []
-                    if metadata.id not in self._tag_index[tag]:
-                        self._tag_index[tag].append(metadata.id)
+                with open(legacy_path, 'r') as f:
+                    index_data = _loads_record(f.read())
+                
+                for item_data in index_data:
+                    metadata = _metadata_from_dict(item_data)
+                    self._index[metadata.id] = metadata
+                
+                self._write_index_snapshot(self._index_snapshot_text())
+            
+            for metadata in self._index.values():
+                self._update_index(metadata)
             
             logger.info(f"Loaded {len(self._index)} items from archival index")
             
@@ -463,24 +676,74 @@ class ArchivalStorage:
         
         # Update tag index
         for tag in metadata.tags:
-            if tag not in self._tag_index:
-                self._tag_index[tag] = []
-            if metadata.id not in self._tag_index[tag]:
-                self._tag_index[tag].append(metadata.id)
+            self._tag_index.setdefault(tag, {})[metadata.id] = None
+    
+    async def _append_index_log(self, record: Dict[str, Any]) -> None:
+        """
+        Append one record to the index log, compacting it when it grows
+        past twice the live index size.
+        
+        Args:
+            record: Log record, {"op": "put", "meta": ...} or {"op": "del", "id": ...}
+        """
+        line = _dumps_record(record) + "\n"
+        async with self._get_index_log_lock():
+            await asyncio.to_thread(_append_text, self._index_log_path, line)
+            self._index_log_lines += 1
+            
+            if self._index_log_lines > 2 * max(len(self._index), self.INDEX_LOG_MIN_COMPACT_LINES):
+                await self._compact_index_log()
+    
+    def _get_index_log_lock(self) -> asyncio.Lock:
+        """
+        Get the index log lock for the running event loop.
+        
+        The storage can outlive the loop that first used it (the module-level
+        instance does), so a new lock is made whenever the loop changes.
+        
+        Returns:
+            Lock serializing index log writes
+        """
+        loop = asyncio.get_running_loop()
+        if self._index_log_lock is None or self._index_log_lock_loop is not loop:
+            self._index_log_lock = asyncio.Lock()
+            self._index_log_lock_loop = loop
+        return self._index_log_lock
+    
+    async def _compact_index_log(self) -> None:
+        """Rewrite the index log as one put record per live item. Caller holds the log lock."""
+        text = self._index_snapshot_text()
+        await asyncio.to_thread(self._write_index_snapshot, text)
+    
+    def _index_snapshot_text(self) -> str:
+        """Serialize the live index as index log put records."""
+        return "".join(
+            _dumps_record({"op": "put", "meta": _metadata_to_dict(metadata)}) + "\n"
+            for metadata in self._index.values()
+        )
+    
+    def _write_index_snapshot(self, text: str) -> None:
+        """Atomically replace the index log with a snapshot."""
+        tmp_path = self._index_log_path.with_name(self._index_log_path.name + ".tmp")
+        _write_text(tmp_path, text)
+        os.replace(tmp_path, self._index_log_path)
+        self._index_log_lines = text.count("\n")
     
     async def save_index(self) -> None:
-        """Save the archival index to disk."""
+        """
+        Save the archival index to disk.
+        
+        Every change is already appended to the index log; this compacts
+        the log down to the live items.
+        """
         try:
             if not self.config.index_enabled:
                 return
             
-            index_path = self.base_path / "index" / "archival_index.json"
-            index_data = [asdict(metadata) for metadata in self._index.values()]
-            
-            with open(index_path, 'w') as f:
-                json.dump(index_data, f, default=str)
+            async with self._get_index_log_lock():
+                await self._compact_index_log()
             
-            logger.info(f"Saved {len(index_data)} items to archival index")
+            logger.info(f"Saved {len(self._index)} items to archival index")
             
         except Exception as e:
             logger.error(f"Failed to save archival index: {str(e)}")
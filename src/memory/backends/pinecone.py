@@ -11,23 +11,44 @@ Production Pinecone vector store implementation with:
 """
 
 import asyncio
+import inspect
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import numpy as np
-
-try:
-    import pinecone
-    from pinecone import ServerlessSpec, PodSpec
-    PINECONE_AVAILABLE = True
-except ImportError:
-    PINECONE_AVAILABLE = False
-    logging.warning("Pinecone not available. Install with: pip install pinecone-client")
+import random
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from datetime import datetime, timezone
 
 from .. import MemoryChunk
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRYABLE_GRPC_CODES = frozenset({"UNAVAILABLE", "DEADLINE_EXCEEDED", "RESOURCE_EXHAUSTED"})
+
+# Placeholder timestamp for results fetched without metadata
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Check whether a failed Pinecone call is worth retrying.
+    
+    Args:
+        error: Exception raised by the call
+        
+    Returns:
+        True for transport failures and retryable API statuses
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # gRPC errors report a status code instead of an HTTP status
+    code = getattr(error, "code", None)
+    if callable(code):
+        return getattr(code(), "name", None) in _RETRYABLE_GRPC_CODES
+    # Pinecone API exceptions carry the HTTP status of the failed request
+    return getattr(error, "status", None) in _RETRYABLE_STATUSES
+
 
 class PineconeVectorStore:
     """
@@ -37,6 +58,22 @@ class PineconeVectorStore:
     with enterprise-grade reliability.
     """
     
+    # Upper bound on waiting for a newly created index to become ready
+    INDEX_READY_TIMEOUT = 600.0
+    INDEX_READY_MAX_DELAY = 30.0
+    
+    # Pinecone rejects upsert requests above 2MB; approximate wire bytes per
+    # vector value for each transport when sizing batches
+    MAX_UPSERT_BYTES = 2_000_000
+    GRPC_BYTES_PER_VALUE = 4
+    JSON_BYTES_PER_VALUE = 20
+    
+    # Most IDs Pinecone accepts in one delete request
+    MAX_DELETE_IDS = 1000
+    
+    # Seconds index statistics are served from cache
+    STATS_CACHE_TTL = 5.0
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Pinecone vector store.
@@ -44,15 +81,27 @@ class PineconeVectorStore:
         Args:
             config: Configuration dictionary with Pinecone settings
         """
-        if not PINECONE_AVAILABLE:
+        # Imported here so loading this module stays cheap without Pinecone
+        try:
+            import pinecone
+        except ImportError:
             raise ImportError("Pinecone not available. Install with: pip install pinecone-client")
+        self._pinecone = pinecone
         
         self.api_key = config.get("api_key")
         self.environment = config.get("environment")
         self.index_name = config.get("index_name", "apex-memory")
         self.dimension = config.get("dimension", 1536)
         self.metric = config.get("metric", "cosine")
-        self.batch_size = config.get("batch_size", 100)
+        self.batch_size = config.get("batch_size", 200)
+        self.pool_threads = config.get("pool_threads", 30)
+        # Keep enough pooled connections for every concurrent request
+        self.connection_pool_maxsize = config.get("connection_pool_maxsize", 64)
+        self.grpc_max_concurrent_streams = config.get("grpc_max_concurrent_streams", 100)
+        # gRPC sends vectors as packed protobuf floats rather than JSON text
+        self.use_grpc = config.get("use_grpc", True)
+        # Partition writes by agent when no namespace is given
+        self.agent_namespaces = config.get("agent_namespaces", False)
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
         
@@ -62,13 +111,63 @@ class PineconeVectorStore:
         # Create or get index
         self._ensure_index()
         
+        # Resolve the data-plane host once so the client never looks it up
+        self.host = pinecone.describe_index(self.index_name).host
+        
         # Get index instance
-        self.index = pinecone.Index(self.index_name)
+        self.index = self._connect_index()
+        
+        # (fetched_at, stats) from the last describe_index_stats call
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Cap batches so one upsert request stays under the payload limit
+        bytes_per_value = self.GRPC_BYTES_PER_VALUE if self.use_grpc else self.JSON_BYTES_PER_VALUE
+        self.upsert_batch_size = max(1, min(
+            self.batch_size, self.MAX_UPSERT_BYTES // (self.dimension * bytes_per_value)
+        ))
         
         logger.info(f"Pinecone vector store initialized: {self.index_name}")
     
+    def _connect_index(self) -> Any:
+        """
+        Create the data-plane client for the index.
+        
+        Uses gRPC when enabled and installed, falling back to REST, whose
+        thread pool serves async_req calls.
+        
+        Returns:
+            Index client
+        """
+        if self.use_grpc:
+            try:
+                from pinecone.grpc import PineconeGRPC, GRPCClientConfig
+            except ImportError:
+                self.use_grpc = False
+            else:
+                grpc_config = GRPCClientConfig(grpc_channel_options={
+                    "grpc.max_concurrent_streams": self.grpc_max_concurrent_streams
+                })
+                return PineconeGRPC(api_key=self.api_key).Index(
+                    name=self.index_name, host=self.host, grpc_config=grpc_config
+                )
+        
+        index_options = {}
+        try:
+            from pinecone.core.client.configuration import Configuration as OpenApiConfiguration
+        except ImportError:
+            pass
+        else:
+            openapi_config = OpenApiConfiguration()
+            openapi_config.connection_pool_maxsize = max(self.connection_pool_maxsize, self.pool_threads)
+            index_options["openapi_config"] = openapi_config
+        
+        return self._pinecone.Index(
+            self.index_name, host=self.host, pool_threads=self.pool_threads, **index_options
+        )
+    
     def _ensure_index(self) -> None:
         """Ensure index exists with proper configuration."""
+        pinecone = self._pinecone
         if self.index_name not in pinecone.list_indexes():
             logger.info(f"Creating new Pinecone index: {self.index_name}")
             
@@ -77,69 +176,53 @@ class PineconeVectorStore:
                 name=self.index_name,
                 dimension=self.dimension,
                 metric=self.metric,
-                spec=ServerlessSpec(
+                spec=pinecone.ServerlessSpec(
                     cloud="aws",
                     region="us-west-2"
                 )
             )
             
-            # Wait for index to be ready
+            # Wait for index to be ready, backing off between polls
             logger.info("Waiting for index to be ready...")
+            deadline = time.monotonic() + self.INDEX_READY_TIMEOUT
+            attempt = 0
             while not pinecone.describe_index(self.index_name).status.ready:
-                asyncio.sleep(1)
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Pinecone index {self.index_name} not ready after "
+                        f"{self.INDEX_READY_TIMEOUT:.0f}s"
+                    )
+                time.sleep(min(self.INDEX_READY_MAX_DELAY, 2 ** attempt))
+                attempt += 1
     
-    async def add_memory(self, chunk: MemoryChunk) -> str:
+    async def add_memory(self, chunk: MemoryChunk, namespace: Optional[str] = None) -> str:
         """
         Add a memory chunk to Pinecone.
         
         Args:
             chunk: Memory chunk with embedding vector
+            namespace: Target namespace (defaults per _write_namespace)
             
         Returns:
             Memory ID
         """
-        if not chunk.vector:
-            raise ValueError("Memory chunk must have embedding vector")
-        
-        # Convert to numpy array for Pinecone
-        vector = np.array(chunk.vector, dtype=np.float32)
-        
-        # Prepare metadata
-        metadata = {
-            "content": chunk.content,
-            "agent_id": chunk.agent_id,
-            "task_id": chunk.task_id or "",
-            "file_path": chunk.file_path or "",
-            "timestamp": chunk.timestamp.isoformat(),
-            "utility_score": chunk.utility_score,
-            "status": chunk.status,
-            "superseded_by": chunk.superseded_by or "",
-        }
+        self._validate_vector(chunk)
+        
+        vectors = [self._to_payload(chunk)]
+        namespace = self._write_namespace(chunk, namespace)
         
         # Upsert to Pinecone with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                self.index.upsert(
-                    vectors=[{
-                        "id": chunk.id,
-                        "values": vector.tolist(),
-                        "metadata": metadata
-                    }]
-                )
-                return chunk.id
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Pinecone upsert failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        await self._with_retry("upsert", self.index.upsert, vectors=vectors, namespace=namespace)
+        return chunk.id
     
-    async def add_memories_batch(self, chunks: List[MemoryChunk]) -> List[str]:
+    async def add_memories_batch(self, chunks: List[MemoryChunk],
+                                 namespace: Optional[str] = None) -> List[str]:
         """
         Add multiple memory chunks in batch.
         
         Args:
             chunks: List of memory chunks
+            namespace: Target namespace (defaults per _write_namespace)
             
         Returns:
             List of memory IDs
@@ -147,54 +230,149 @@ class PineconeVectorStore:
         if not chunks:
             return []
         
-        # Validate all chunks have vectors
+        # Validate every vector before sending anything
         for chunk in chunks:
-            if not chunk.vector:
-                raise ValueError("All memory chunks must have embedding vectors")
+            self._validate_vector(chunk)
+        
+        # Group by namespace, since each upsert targets exactly one
+        groups: Dict[Optional[str], List[MemoryChunk]] = {}
+        for chunk in chunks:
+            groups.setdefault(self._write_namespace(chunk, namespace), []).append(chunk)
+        
+        # Prepare every batch up front
+        batches = [
+            (group_namespace, [self._to_payload(chunk) for chunk in group[i:i + self.upsert_batch_size]])
+            for group_namespace, group in groups.items()
+            for i in range(0, len(group), self.upsert_batch_size)
+        ]
+        
+        # Upsert all batches in parallel; each one retries independently
+        await asyncio.gather(*(
+            self._with_retry(
+                "batch upsert", self._async_request, self.index.upsert,
+                vectors=vectors, namespace=group_namespace
+            )
+            for group_namespace, vectors in batches
+        ))
+        
+        return [chunk.id for chunk in chunks]
+    
+    def _validate_vector(self, chunk: MemoryChunk) -> None:
+        """
+        Check a chunk's embedding before it is sent to Pinecone.
+        
+        Args:
+            chunk: Memory chunk to validate
+            
+        Raises:
+            ValueError: If the vector is missing or has the wrong dimension
+        """
+        if chunk.vector is None:
+            raise ValueError(f"Memory chunk {chunk.id} must have embedding vector")
+        if len(chunk.vector) != self.dimension:
+            raise ValueError(
+                f"Memory chunk {chunk.id} vector has dimension {len(chunk.vector)}, "
+                f"index expects {self.dimension}"
+            )
+    
+    def _write_namespace(self, chunk: MemoryChunk, namespace: Optional[str]) -> Optional[str]:
+        """
+        Resolve the namespace a chunk is written to.
+        
+        Args:
+            chunk: Memory chunk being written
+            namespace: Explicitly requested namespace
+            
+        Returns:
+            The explicit namespace, else the chunk's agent when agent
+            namespaces are enabled, else None for the default namespace
+        """
+        if namespace is not None:
+            return namespace
+        return chunk.agent_id if self.agent_namespaces else None
+    
+    @staticmethod
+    def _to_payload(chunk: MemoryChunk) -> Dict[str, Any]:
+        """
+        Build the upsert payload for a memory chunk.
+        
+        Args:
+            chunk: Memory chunk with embedding vector
+            
+        Returns:
+            Vector payload with id, values and metadata
+        """
+        return {
+            "id": chunk.id,
+            "values": chunk.vector,
+            "metadata": {
+                "content": chunk.content,
+                "agent_id": chunk.agent_id,
+                "task_id": chunk.task_id or "",
+                "file_path": chunk.file_path or "",
+                "timestamp": chunk.timestamp.timestamp(),
+                "utility_score": chunk.utility_score,
+                "status": chunk.status,
+                "superseded_by": chunk.superseded_by or "",
+            }
+        }
+    
+    async def _with_retry(self, operation: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a Pinecone operation, retrying transient failures.
+        
+        Retries use exponential backoff with full jitter so concurrent
+        callers hitting the same rate limit do not retry in lockstep.
         
-        # Process in batches
-        all_ids = []
-        for i in range(0, len(chunks), self.batch_size):
-            batch = chunks[i:i + self.batch_size]
+        Args:
+            operation: Operation name for logging
+            fn: Callable to invoke; may return an awaitable
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
             
-            # Prepare batch data
-            vectors = []
-            for chunk in batch:
-                vector = np.array(chunk.vector, dtype=np.float32)
-                metadata = {
-                    "content": chunk.content,
-                    "agent_id": chunk.agent_id,
-                    "task_id": chunk.task_id or "",
-                    "file_path": chunk.file_path or "",
-                    "timestamp": chunk.timestamp.isoformat(),
-                    "utility_score": chunk.utility_score,
-                    "status": chunk.status,
-                    "superseded_by": chunk.superseded_by or "",
-                }
+        Returns:
+            Result of the call
+        """
+        # Always make at least one call, so this either returns or raises
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            try:
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
                 
-                vectors.append({
-                    "id": chunk.id,
-                    "values": vector.tolist(),
-                    "metadata": metadata
-                })
+            except Exception as e:
+                if attempt == attempts - 1 or not _is_retryable(e):
+                    raise
+                logger.warning(f"Pinecone {operation} failed (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(random.uniform(0, self.retry_delay * (2 ** attempt)))
+    
+    async def _async_request(self, fn: Callable[..., Any], **kwargs) -> Any:
+        """
+        Run an index call without blocking the loop.
+        
+        REST calls go through async_req on the index thread pool. The gRPC
+        index does not offer async_req for every call, so those run on a
+        worker thread instead.
+        
+        Args:
+            fn: Index method to call
+            **kwargs: Keyword arguments for fn
             
-            # Upsert batch with retry logic
-            for attempt in range(self.max_retries):
-                try:
-                    self.index.upsert(vectors=vectors)
-                    all_ids.extend([chunk.id for chunk in batch])
-                    break
-                    
-                except Exception as e:
-                    if attempt == self.max_retries - 1:
-                        raise
-                    logger.warning(f"Pinecone batch upsert failed (attempt {attempt + 1}): {e}")
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
-        
-        return all_ids
+        Returns:
+            Result of the call
+        """
+        if self.use_grpc:
+            return await asyncio.to_thread(fn, **kwargs)
+        
+        request = fn(**kwargs, async_req=True)
+        return await asyncio.get_running_loop().run_in_executor(None, request.get)
     
     async def search(self, query_vector: List[float], top_k: int = 5,
-                     min_similarity: float = 0.82, filter_dict: Optional[Dict[str, Any]] = None) -> List[MemoryChunk]:
+                     min_similarity: float = 0.82, filter_dict: Optional[Dict[str, Any]] = None,
+                     include_values: bool = False, namespace: Optional[str] = None,
+                     include_metadata: bool = True) -> List[MemoryChunk]:
         """
         Search for similar memories.
         
@@ -202,51 +380,143 @@ class PineconeVectorStore:
             query_vector: Query embedding vector
             top_k: Number of results to return
             min_similarity: Minimum cosine similarity threshold
-            filter_dict: Optional metadata filters
+            filter_dict: Optional metadata filters; deprecated memories are
+                excluded unless this filters on status
+            include_values: Return each match's stored embedding as its vector
+            namespace: Namespace to search (None for the default namespace)
+            include_metadata: Fetch stored metadata; when False, results are
+                ID-only stubs with empty content
             
         Returns:
             List of top-K similar memory chunks
         """
-        # Convert to numpy array
-        query_vector = np.array(query_vector, dtype=np.float32)
-        
-        # Prepare query
+        # Sent as given, the same way search_batch sends each query
         query_params = {
-            "vector": query_vector.tolist(),
+            "vector": query_vector,
             "top_k": top_k,
-            "include_metadata": True
+            "include_metadata": include_metadata,
+            "include_values": include_values,
+            "namespace": namespace,
+            "filter": self._query_filter(filter_dict)
         }
         
-        # Add filters if provided
-        if filter_dict:
-            query_params["filter"] = filter_dict
-        
         # Query with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                results = self.index.query(**query_params)
-                break
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Pinecone query failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        results = await self._with_retry("query", self.index.query, **query_params)
+        
+        return self._to_memories(results, min_similarity)
+    
+    async def search_batch(self, query_vectors: List[List[float]], top_k: int = 5,
+                           min_similarity: float = 0.82,
+                           filter_dict: Optional[Dict[str, Any]] = None,
+                           include_values: bool = False,
+                           namespace: Optional[str] = None,
+                           include_metadata: bool = True) -> List[List[MemoryChunk]]:
+        """
+        Search for similar memories for several queries at once.
+        
+        Queries run in parallel on the index thread pool, so a batch
+        costs roughly one round-trip instead of one per query.
+        
+        Args:
+            query_vectors: Query embedding vectors
+            top_k: Number of results to return per query
+            min_similarity: Minimum cosine similarity threshold
+            filter_dict: Optional metadata filters; deprecated memories are
+                excluded unless this filters on status
+            include_values: Return each match's stored embedding as its vector
+            namespace: Namespace to search (None for the default namespace)
+            include_metadata: Fetch stored metadata; when False, results are
+                ID-only stubs with empty content
+            
+        Returns:
+            List of top-K similar memory chunks for each query, in query order
+        """
+        if not query_vectors:
+            return []
         
-        # Convert results to MemoryChunk objects
+        query_filter = self._query_filter(filter_dict)
+        query_params = [
+            {
+                "vector": query_vector,
+                "top_k": top_k,
+                "include_metadata": include_metadata,
+                "include_values": include_values,
+                "namespace": namespace,
+                "filter": query_filter
+            }
+            for query_vector in query_vectors
+        ]
+        
+        all_results = await asyncio.gather(*(
+            self._with_retry("query", self._async_request, self.index.query, **params)
+            for params in query_params
+        ))
+        
+        return [self._to_memories(results, min_similarity) for results in all_results]
+    
+    @staticmethod
+    def _query_filter(filter_dict: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the metadata filter for a query.
+        
+        Deprecated memories are excluded server-side unless the caller
+        filters on status themselves.
+        
+        Args:
+            filter_dict: Optional caller metadata filters
+            
+        Returns:
+            Metadata filter to send with the query
+        """
+        if filter_dict and "status" in filter_dict:
+            return filter_dict
+        return {**(filter_dict or {}), "status": {"$ne": "deprecated"}}
+    
+    @staticmethod
+    def _to_memories(results: Dict[str, Any], min_similarity: float) -> List[MemoryChunk]:
+        """
+        Convert query matches above the similarity threshold to memory chunks.
+        
+        Args:
+            results: Raw query response
+            min_similarity: Minimum cosine similarity threshold
+            
+        Returns:
+            List of memory chunks
+        """
         memories = []
         for match in results["matches"]:
             if match["score"] >= min_similarity:
-                metadata = match["metadata"]
+                metadata = match.get("metadata")
+                if not metadata:
+                    # Metadata was not requested; return an ID-only stub
+                    memories.append(MemoryChunk(
+                        id=match["id"],
+                        content="",
+                        agent_id="",
+                        task_id=None,
+                        file_path=None,
+                        timestamp=_EPOCH,
+                        utility_score=0.0,
+                        vector=match.get("values") or None
+                    ))
+                    continue
+                
+                timestamp = metadata["timestamp"]
+                if isinstance(timestamp, str):
+                    # Written before timestamps were stored as epoch seconds
+                    timestamp = datetime.fromisoformat(timestamp)
+                else:
+                    timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                 memory = MemoryChunk(
                     id=match["id"],
                     content=metadata["content"],
                     agent_id=metadata["agent_id"],
                     task_id=metadata.get("task_id") or None,
                     file_path=metadata.get("file_path") or None,
-                    timestamp=datetime.fromisoformat(metadata["timestamp"]),
+                    timestamp=timestamp,
                     utility_score=metadata["utility_score"],
-                    vector=query_vector.tolist(),  # Store query vector for reference
+                    vector=match.get("values") or None,  # Only present when requested
                     status=metadata["status"],
                     superseded_by=metadata.get("superseded_by") or None
                 )
@@ -254,13 +524,15 @@ class PineconeVectorStore:
         
         return memories
     
-    async def deprecate_memory(self, memory_id: str, superseded_by: str) -> None:
+    async def deprecate_memory(self, memory_id: str, superseded_by: str,
+                               namespace: Optional[str] = None) -> None:
         """
         Mark a memory as deprecated and link to its replacement.
         
         Args:
             memory_id: ID of deprecated memory
             superseded_by: ID of new memory that replaces it
+            namespace: Namespace holding the memory
         """
         # Update metadata
         update_data = {
@@ -268,55 +540,69 @@ class PineconeVectorStore:
             "set_metadata": {
                 "status": "deprecated",
                 "superseded_by": superseded_by
-            }
+            },
+            "namespace": namespace
         }
         
         # Update with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                self.index.update(**update_data)
-                return
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Pinecone update failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        await self._with_retry("update", self.index.update, **update_data)
     
-    async def delete_memory(self, memory_id: str) -> None:
+    async def delete_memory(self, memory_id: str, namespace: Optional[str] = None) -> None:
         """
         Delete a memory from the store.
         
         Args:
             memory_id: ID of memory to delete
+            namespace: Namespace holding the memory
         """
         # Delete with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                self.index.delete(ids=[memory_id])
-                return
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Pinecone delete failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        await self._with_retry("delete", self.index.delete, ids=[memory_id], namespace=namespace)
+    
+    async def delete_memories_batch(self, memory_ids: List[str], namespace: Optional[str] = None) -> None:
+        """
+        Delete multiple memories from the store.
+        
+        IDs are sent in slices of up to MAX_DELETE_IDS, all in parallel.
+        
+        Args:
+            memory_ids: IDs of memories to delete
+            namespace: Namespace holding the memories
+        """
+        if not memory_ids:
+            return
+        
+        await asyncio.gather(*(
+            self._with_retry(
+                "batch delete", self._async_request, self.index.delete,
+                ids=memory_ids[i:i + self.MAX_DELETE_IDS], namespace=namespace
+            )
+            for i in range(0, len(memory_ids), self.MAX_DELETE_IDS)
+        ))
     
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get index statistics.
         
+        Results are cached for STATS_CACHE_TTL seconds so frequent polling
+        does not hit the Pinecone API on every call.
+        
         Returns:
             Dictionary with index statistics
         """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < self.STATS_CACHE_TTL:
+            return dict(self._stats_cache[1])
+        
         try:
             stats = self.index.describe_index_stats()
-            return {
+            result = {
                 "dimension": stats.dimension,
                 "index_fullness": stats.index_fullness,
                 "total_vector_count": stats.total_vector_count,
                 "namespaces": stats.namespaces
             }
+            self._stats_cache = (now, result)
+            return dict(result)
         except Exception as e:
             logger.error(f"Failed to get Pinecone stats: {e}")
             return {}
@@ -11,24 +11,135 @@ Production Weaviate vector store implementation with:
 """
 
 import asyncio
+import functools
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Set, Sequence, Callable
+from datetime import datetime, timezone
+import numpy as np
 
 try:
-    import weaviate
-    from weaviate.client import Client
-    from weaviate.config import ConnectionConfig, Auth
-    WEAVIATE_AVAILABLE = True
+    # Transport errors raised by the v3 client's HTTP session
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+    _TRANSPORT_ERRORS = (ConnectionError, TimeoutError, RequestsConnectionError, RequestsTimeout)
 except ImportError:
-    WEAVIATE_AVAILABLE = False
-    logging.warning("Weaviate not available. Install with: pip install weaviate-client")
+    _TRANSPORT_ERRORS = (ConnectionError, TimeoutError)
 
 from .. import MemoryChunk
 
 logger = logging.getLogger(__name__)
 
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+_WHERE_OPERATORS = {
+    "eq": "Equal",
+    "ne": "NotEqual",
+    "gt": "GreaterThan",
+    "gte": "GreaterThanEqual",
+    "lt": "LessThan",
+    "lte": "LessThanEqual",
+    "like": "Like",
+    "in": "In",
+    "not_in": "NotIn"
+}
+
+# Where-filter value key per schema data type; Weaviate rejects a key that
+# does not match the property, e.g. valueInt on a number property
+_DATA_TYPE_VALUE_KEYS = {
+    "text": "valueText",
+    "string": "valueText",
+    "int": "valueInt",
+    "number": "valueNumber",
+    "boolean": "valueBoolean",
+    "date": "valueDate",
+}
+
+# Fallback value key per Python type, for properties missing from the
+# schema; keyed on the exact type so bool is not treated as int
+_WHERE_VALUE_KEYS = {
+    bool: "valueBoolean",
+    int: "valueInt",
+    float: "valueNumber",
+    str: "valueText",
+    datetime: "valueDate",
+}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Check whether a failed Weaviate call is worth retrying.
+    
+    Args:
+        error: Exception raised by the call
+        
+    Returns:
+        True for transport failures and retryable API statuses
+    """
+    if isinstance(error, _TRANSPORT_ERRORS):
+        return True
+    # UnexpectedStatusCodeException carries the HTTP status of the response
+    return getattr(error, "status_code", None) in _RETRYABLE_STATUSES
+
+
+def _where_operand(field: str, operator: str, value: Any, value_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a single where-filter operand with a value key matching its type.
+    
+    Typed keys let Weaviate use its inverted index for numbers, booleans
+    and dates instead of comparing text.
+    
+    Args:
+        field: Property name
+        operator: Weaviate operator name
+        value: Value to compare against
+        value_key: Value key for the property's schema data type; when
+            None it is chosen from the value's Python type
+        
+    Returns:
+        Where-filter operand
+    """
+    if value_key is None:
+        # Anything else is compared as text, as before
+        value_key = _WHERE_VALUE_KEYS.get(type(value), "valueText")
+    
+    if value_key == "valueDate":
+        # valueDate requires RFC 3339; naive datetimes are taken as UTC
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            value = value.isoformat()
+    elif value_key == "valueNumber":
+        # Whole numbers compared against a number property
+        if type(value) is int:
+            value = float(value)
+    elif value_key == "valueText" and not isinstance(value, str):
+        value = str(value)
+    
+    return {"path": [field], "operator": operator, value_key: value}
+
+
+@functools.lru_cache(maxsize=None)
+def _api_key_auth(api_key: str) -> Any:
+    """
+    Build the API key auth config, shared by every store using that key.
+    
+    Args:
+        api_key: Weaviate API key
+        
+    Returns:
+        Auth config for ConnectionConfig
+    """
+    from weaviate.config import Auth
+    return Auth.api_key(api_key)
+
 
 class WeaviateVectorStore:
     """
@@ -38,6 +149,29 @@ class WeaviateVectorStore:
     schema management, and hybrid search.
     """
     
+    # Upper bound in seconds for a single retry backoff
+    RETRY_MAX_DELAY = 30.0
+    
+    # Seconds the class schema is served from cache
+    SCHEMA_CACHE_TTL = 60.0
+    
+    # Most objects one batch delete removes (the server's default
+    # QUERY_MAXIMUM_RESULTS)
+    MAX_DELETE_OBJECTS = 10000
+    
+    # Properties fetched by search and hybrid_search unless the caller
+    # projects a narrower set
+    DEFAULT_FIELDS = (
+        "content",
+        "agent_id",
+        "task_id",
+        "file_path",
+        "timestamp",
+        "utility_score",
+        "status",
+        "superseded_by",
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Weaviate vector store.
@@ -45,15 +179,56 @@ class WeaviateVectorStore:
         Args:
             config: Configuration dictionary with Weaviate settings
         """
-        if not WEAVIATE_AVAILABLE:
+        # Imported here so loading this module stays cheap without Weaviate
+        try:
+            import weaviate
+        except ImportError:
             raise ImportError("Weaviate not available. Install with: pip install weaviate-client")
+        self._weaviate = weaviate
         
         self.url = config.get("url", "http://localhost:8080")
         self.api_key = config.get("api_key")
         self.batch_size = config.get("batch_size", 100)
+        # Threads the client batcher uses to send batches concurrently
+        self.num_workers = config.get("num_workers", os.cpu_count() or 1)
+        # Pooled HTTP connections kept open to the server
+        self.pool_size = config.get("pool_size", 100)
         self.max_retries = config.get("max_retries", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
+        # Single writes are buffered until flush_size or flush_ms is reached
+        self.flush_size = config.get("flush_size", 64)
+        self.flush_ms = config.get("flush_ms", 50)
         self.class_name = "MemoryChunk"
+        # Server-side vector quantization ("sq", "pq" or "bq"); only applied
+        # when the class is created
+        self.vector_quantization = config.get("vector_quantization")
+        
+        # Recent search results, reused for near-identical queries. Off by
+        # default: writes from other clients do not invalidate it, so
+        # entries are only trusted for cache_ttl seconds
+        self.cache_size = config.get("cache_size", 0)
+        self.cache_sim_threshold = config.get("cache_sim_threshold", 0.97)
+        self.cache_ttl = config.get("cache_ttl", 30.0)
+        
+        self._pending: List[Tuple[MemoryChunk, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # The client is synchronous; its calls run on this pool so they do
+        # not block the event loop, one thread per pooled connection
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="weaviate")
+        # The client has one shared batcher, so imports take turns on it
+        self._batch_lock = threading.Lock()
+        
+        # Query cache: LRU of slot -> (query key, results, stored_at), with
+        # each slot's unit query vector in a row of _qcache_vectors
+        self._qcache: "OrderedDict[int, Tuple[str, List[MemoryChunk], float]]" = OrderedDict()
+        self._qcache_vectors: Optional[np.ndarray] = None
+        self._qcache_generation = 0
+        
+        # (fetched_at, schema) from the last schema.get call
+        self._schema_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Property name -> where-filter value key, from the class schema
+        self._value_keys: Dict[str, str] = {}
         
         # Initialize Weaviate client
         self.client = self._create_client()
@@ -63,18 +238,24 @@ class WeaviateVectorStore:
         
         logger.info(f"Weaviate vector store initialized: {self.url}")
     
-    def _create_client(self) -> Client:
+    def _create_client(self) -> Any:
         """Create Weaviate client with authentication."""
+        from weaviate.config import ConnectionConfig
+        
         auth_config = None
         if self.api_key:
-            auth_config = Auth.api_key(self.api_key)
+            auth_config = _api_key_auth(self.api_key)
         
+        # Size the session pool for concurrent requests and batch workers,
+        # so they reuse keep-alive connections instead of queueing
         connection_config = ConnectionConfig.from_url(
             url=self.url,
-            auth_config=auth_config
+            auth_config=auth_config,
+            session_pool_connections=self.pool_size,
+            session_pool_maxsize=self.pool_size
         )
         
-        return weaviate.Client(connection_config)
+        return self._weaviate.Client(connection_config)
     
     def _ensure_schema(self) -> None:
         """Ensure the MemoryChunk class schema exists."""
@@ -131,53 +312,128 @@ class WeaviateVectorStore:
             ]
         }
         
+        # Quantized HNSW search; Weaviate rescores candidates against the
+        # full-precision vectors before returning them
+        if self.vector_quantization:
+            schema["vectorIndexConfig"] = {self.vector_quantization: {"enabled": True}}
+        
         # Check if class exists
         existing = self.client.schema.get(self.class_name)
         if not existing:
             logger.info(f"Creating Weaviate class: {self.class_name}")
             self.client.schema.create_class(schema)
+        else:
+            # Seed the cache so the first get_stats call is free
+            self._schema_cache = (time.monotonic(), existing)
+        
+        # Filter value keys follow the server's property types when known
+        properties = (existing or {}).get("properties") or schema["properties"]
+        self._value_keys = {
+            prop["name"]: _DATA_TYPE_VALUE_KEYS[prop["dataType"][0]]
+            for prop in properties
+            if prop.get("dataType") and prop["dataType"][0] in _DATA_TYPE_VALUE_KEYS
+        }
+    
+    def _cached_schema(self) -> Dict[str, Any]:
+        """
+        Get the class schema, cached for SCHEMA_CACHE_TTL seconds.
+        
+        Returns:
+            Class schema as returned by Weaviate
+        """
+        now = time.monotonic()
+        if self._schema_cache is not None and now - self._schema_cache[0] < self.SCHEMA_CACHE_TTL:
+            return self._schema_cache[1]
+        
+        schema = self.client.schema.get(self.class_name)
+        self._schema_cache = (now, schema)
+        return schema
     
     async def add_memory(self, chunk: MemoryChunk) -> str:
         """
         Add a memory chunk to Weaviate.
         
+        Chunks are buffered and imported together once flush_size are
+        waiting or flush_ms has passed, so bursts of single writes share
+        one batch request. Returns once this chunk has been imported.
+        
         Args:
             chunk: Memory chunk with embedding vector
             
         Returns:
             Memory ID
         """
-        if not chunk.vector:
+        # len() rather than truthiness, so numpy vectors are accepted
+        if chunk.vector is None or len(chunk.vector) == 0:
             raise ValueError("Memory chunk must have embedding vector")
         
-        # Prepare data object
-        data_object = {
-            "content": chunk.content,
-            "agent_id": chunk.agent_id,
-            "task_id": chunk.task_id or "",
-            "file_path": chunk.file_path or "",
-            "timestamp": chunk.timestamp.isoformat(),
-            "utility_score": chunk.utility_score,
-            "status": chunk.status,
-            "superseded_by": chunk.superseded_by or "",
-        }
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((chunk, future))
         
-        # Add with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                result = self.client.data_object.create(
-                    data_object=data_object,
-                    class_name=self.class_name,
-                    vector=chunk.vector,
-                    uuid=chunk.id
-                )
-                return chunk.id
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Weaviate create failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        if len(self._pending) >= self.flush_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_ms / 1000, self._start_flush)
+        
+        await future
+        return chunk.id
+    
+    def _start_flush(self) -> None:
+        """Hand the buffered chunks to a background flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        
+        task = asyncio.ensure_future(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, pending: List[Tuple[MemoryChunk, asyncio.Future]]) -> None:
+        """
+        Import buffered chunks and resolve their waiting callers.
+        
+        Args:
+            pending: Buffered chunks with the futures their callers await
+        """
+        try:
+            errors = await self._run_blocking(self._import_batch, [chunk for chunk, _ in pending])
+        except Exception as e:
+            logger.warning(f"Weaviate buffered import failed: {e}")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._invalidate_query_cache()
+        
+        for chunk, future in pending:
+            if future.done():
+                continue
+            if chunk.id in errors:
+                future.set_exception(RuntimeError(f"Weaviate import failed for {chunk.id}: {errors[chunk.id]}"))
+            else:
+                future.set_result(None)
+    
+    async def close(self) -> None:
+        """
+        Flush buffered writes and release the worker threads.
+        
+        Waits until every buffered chunk has been imported and its caller
+        resolved; the store must not be used afterwards.
+        """
+        self._start_flush()
+        while self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+            # Writes buffered while waiting get flushed too
+            self._start_flush()
+        
+        # Searches already queued on the pool still run to completion
+        self._executor.shutdown(wait=False)
     
     async def add_memories_batch(self, chunks: List[MemoryChunk]) -> List[str]:
         """
@@ -194,49 +450,89 @@ class WeaviateVectorStore:
         
         # Validate all chunks have vectors
         for chunk in chunks:
-            if not chunk.vector:
+            if chunk.vector is None or len(chunk.vector) == 0:
                 raise ValueError("All memory chunks must have embedding vectors")
         
-        # Configure batch
-        self.client.batch.configure(
-            batch_size=self.batch_size,
-            dynamic=True,
-            callback=self._batch_callback
-        )
-        
-        # Add chunks to batch
-        all_ids = []
-        with self.client.batch as batch:
-            for chunk in chunks:
-                data_object = {
-                    "content": chunk.content,
-                    "agent_id": chunk.agent_id,
-                    "task_id": chunk.task_id or "",
-                    "file_path": chunk.file_path or "",
-                    "timestamp": chunk.timestamp.isoformat(),
-                    "utility_score": chunk.utility_score,
-                    "status": chunk.status,
-                    "superseded_by": chunk.superseded_by or "",
-                }
-                
-                batch.add_data_object(
-                    data_object=data_object,
-                    class_name=self.class_name,
-                    vector=chunk.vector,
-                    uuid=chunk.id
-                )
-                all_ids.append(chunk.id)
+        all_ids = [chunk.id for chunk in chunks]
+        # The batcher blocks until every batch is sent, so keep it off the
+        # event loop; searches keep running during large imports
+        try:
+            await self._run_blocking(self._import_batch, chunks)
+        finally:
+            self._invalidate_query_cache()
         
         return all_ids
     
-    def _batch_callback(self, results: List[Dict[str, Any]]) -> None:
-        """Callback for batch operations."""
-        for result in results:
-            if result.get("result", {}).get("errors"):
-                logger.error(f"Batch error: {result}")
+    def _import_batch(self, chunks: List[MemoryChunk]) -> Dict[str, Any]:
+        """
+        Import chunks through the client batcher.
+        
+        Blocking; callers run it in a worker thread and invalidate the query
+        cache once it returns.
+        
+        Args:
+            chunks: Memory chunks with embedding vectors
+            
+        Returns:
+            Errors reported by Weaviate, keyed by object ID
+        """
+        errors: Dict[str, Any] = {}
+        
+        def callback(results: List[Dict[str, Any]]) -> None:
+            for result in results:
+                result_errors = result.get("result", {}).get("errors")
+                if result_errors:
+                    logger.error(f"Batch error: {result}")
+                    errors[result.get("id")] = result_errors
+        
+        with self._batch_lock:
+            # Configure batch
+            self.client.batch.configure(
+                batch_size=self.batch_size,
+                dynamic=True,
+                num_workers=self.num_workers,
+                timeout_retries=self.max_retries,
+                callback=callback
+            )
+            
+            # Add chunks to batch; the import upserts by ID, so a repeated ID
+            # is sent once with its latest version
+            with self.client.batch as batch:
+                for chunk in {chunk.id: chunk for chunk in chunks}.values():
+                    batch.add_data_object(
+                        data_object=self._to_data_object(chunk),
+                        class_name=self.class_name,
+                        vector=chunk.vector,
+                        uuid=chunk.id
+                    )
+        
+        return errors
+    
+    @staticmethod
+    def _to_data_object(chunk: MemoryChunk) -> Dict[str, Any]:
+        """
+        Build the Weaviate properties for a memory chunk.
+        
+        Args:
+            chunk: Memory chunk
+            
+        Returns:
+            Data object properties
+        """
+        return {
+            "content": chunk.content,
+            "agent_id": chunk.agent_id,
+            "task_id": chunk.task_id or "",
+            "file_path": chunk.file_path or "",
+            "timestamp": chunk.timestamp.isoformat(),
+            "utility_score": chunk.utility_score,
+            "status": chunk.status,
+            "superseded_by": chunk.superseded_by or "",
+        }
     
     async def search(self, query_vector: List[float], top_k: int = 5,
-                     min_similarity: float = 0.82, filter_dict: Optional[Dict[str, Any]] = None) -> List[MemoryChunk]:
+                     min_similarity: float = 0.82, filter_dict: Optional[Dict[str, Any]] = None,
+                     fields: Optional[Sequence[str]] = None) -> List[MemoryChunk]:
         """
         Search for similar memories.
         
@@ -245,10 +541,27 @@ class WeaviateVectorStore:
             top_k: Number of results to return
             min_similarity: Minimum similarity threshold
             filter_dict: Optional metadata filters
+            fields: Properties to fetch (defaults to DEFAULT_FIELDS); fields
+                left out are returned empty
             
         Returns:
             List of top-K similar memory chunks
         """
+        # Serve near-identical repeated queries from the cache
+        cache_query = None
+        if self.cache_size > 0:
+            cache_query = np.array(query_vector, dtype=np.float32)
+            norm = float(np.linalg.norm(cache_query))
+            if norm > 0:
+                cache_query /= norm
+                cache_key = json.dumps([top_k, min_similarity, filter_dict, fields], sort_keys=True, default=str)
+                cached = self._cache_lookup(cache_query, cache_key)
+                if cached is not None:
+                    return cached
+                cache_generation = self._qcache_generation
+            else:
+                cache_query = None
+        
         # Build near vector query
         near_vector = {"vector": query_vector}
         
@@ -256,18 +569,10 @@ class WeaviateVectorStore:
         certainty = (1 + min_similarity) / 2
         near_vector["certainty"] = certainty
         
-        # Build query
-        query = self.client.query.get(self.class_name, [
-            "content",
-            "agent_id",
-            "task_id",
-            "file_path",
-            "timestamp",
-            "utility_score",
-            "status",
-            "superseded_by",
-            "_additional {id certainty}"
-        ])
+        # Build query, fetching only the requested properties
+        properties = list(fields or self.DEFAULT_FIELDS)
+        properties.append("_additional {id certainty}")
+        query = self.client.query.get(self.class_name, properties)
         
         # Add filters if provided
         if filter_dict:
@@ -277,77 +582,129 @@ class WeaviateVectorStore:
         # Execute near vector search
         query = query.with_near_vector(near_vector).with_limit(top_k)
         
-        # Execute with retry logic
-        for attempt in range(self.max_retries):
+        result = await self._with_retry("query", query.do)
+        
+        # Weaviate already applied the certainty threshold
+        memories = self._to_memories(result, query_vector)
+        
+        # Skip caching if a write landed while the query was in flight
+        if cache_query is not None and cache_generation == self._qcache_generation:
+            self._cache_store(cache_query, cache_key, memories)
+        
+        return memories
+    
+    async def _with_retry(self, operation: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a Weaviate operation, retrying transient failures.
+        
+        Retries use decorrelated jitter backoff so concurrent callers do not
+        retry in lockstep. Other errors, including programming errors,
+        are raised immediately.
+        
+        Args:
+            operation: Operation name for logging
+            fn: Blocking client call to invoke
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+            
+        Returns:
+            Result of the call
+        """
+        # Always make at least one call, so this either returns or raises
+        attempts = max(1, self.max_retries)
+        delay = self.retry_delay
+        for attempt in range(attempts):
             try:
-                result = query.do()
-                break
+                return await self._run_blocking(fn, *args, **kwargs)
                 
             except Exception as e:
-                if attempt == self.max_retries - 1:
+                if attempt == attempts - 1 or not _is_retryable(e):
                     raise
-                logger.warning(f"Weaviate query failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
-        
-        # Convert results to MemoryChunk objects
-        memories = []
-        if result and "data" in result and "Get" in result["data"]:
-            for item in result["data"]["Get"][self.class_name]:
-                # Convert certainty back to cosine similarity
-                certainty = item["_additional"]["certainty"]
-                similarity = (certainty * 2) - 1
-                
-                if similarity >= min_similarity:
-                    memory = MemoryChunk(
-                        id=item["_additional"]["id"],
-                        content=item["content"],
-                        agent_id=item["agent_id"],
-                        task_id=item.get("task_id") or None,
-                        file_path=item.get("file_path") or None,
-                        timestamp=datetime.fromisoformat(item["timestamp"]),
-                        utility_score=item["utility_score"],
-                        vector=query_vector,  # Store query vector for reference
-                        status=item["status"],
-                        superseded_by=item.get("superseded_by") or None
-                    )
-                    memories.append(memory)
+                logger.warning(f"Weaviate {operation} failed (attempt {attempt + 1}): {e}")
+                delay = min(self.RETRY_MAX_DELAY, random.uniform(self.retry_delay, delay * 3))
+                await asyncio.sleep(delay)
+    
+    async def _run_blocking(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking client call on the store's thread pool.
         
-        return memories
+        Args:
+            fn: Callable to invoke
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+            
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+    
+    def _cache_lookup(self, query: np.ndarray, key: str) -> Optional[List[MemoryChunk]]:
+        """
+        Find unexpired cached results for a query close enough to this one.
+        
+        Args:
+            query: Unit-length query vector
+            key: Serialized search parameters that must match exactly
+            
+        Returns:
+            Cached results, or None on a miss
+        """
+        if not self._qcache or self._qcache_vectors.shape[1] != query.shape[0]:
+            return None
+        
+        # One matrix-vector product scores every cached query; free rows are zero
+        sims = self._qcache_vectors @ query
+        hits = np.flatnonzero(sims >= self.cache_sim_threshold)
+        expired_before = time.monotonic() - self.cache_ttl
+        for slot in hits[np.argsort(-sims[hits])].tolist():
+            entry = self._qcache.get(slot)
+            if entry is not None and entry[0] == key and entry[2] >= expired_before:
+                self._qcache.move_to_end(slot)
+                return list(entry[1])
+        return None
+    
+    def _cache_store(self, query: np.ndarray, key: str, memories: List[MemoryChunk]) -> None:
+        """
+        Cache search results, evicting the least recently used entry when full.
+        
+        Args:
+            query: Unit-length query vector
+            key: Serialized search parameters
+            memories: Results to cache
+        """
+        if self._qcache_vectors is None or self._qcache_vectors.shape[1] != query.shape[0]:
+            self._qcache.clear()
+            self._qcache_vectors = np.zeros((self.cache_size, query.shape[0]), dtype=np.float32)
+        
+        if len(self._qcache) >= self.cache_size:
+            slot, _ = self._qcache.popitem(last=False)
+        else:
+            # Slots fill in order and are only ever freed all at once
+            slot = len(self._qcache)
+        
+        self._qcache_vectors[slot] = query
+        self._qcache[slot] = (key, list(memories), time.monotonic())
+    
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached search results after the stored data changes."""
+        self._qcache_generation += 1
+        if self._qcache:
+            self._qcache.clear()
+            self._qcache_vectors.fill(0)
     
     def _build_where_filter(self, filter_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Build Weaviate where filter from dictionary."""
         if not filter_dict:
             return {}
         
-        operators = {
-            "eq": "Equal",
-            "ne": "NotEqual",
-            "gt": "GreaterThan",
-            "gte": "GreaterThanEqual",
-            "lt": "LessThan",
-            "lte": "LessThanEqual",
-            "like": "Like",
-            "in": "In",
-            "not_in": "NotIn"
-        }
-        
-        filters = []
-        for field, condition in filter_dict.items():
-            if isinstance(condition, dict):
-                for op, value in condition.items():
-                    if op in operators:
-                        filters.append({
-                            "path": [field],
-                            "operator": operators[op],
-                            "valueText": value if isinstance(value, str) else str(value)
-                        })
-            else:
-                # Default to equality
-                filters.append({
-                    "path": [field],
-                    "operator": "Equal",
-                    "valueText": condition if isinstance(condition, str) else str(condition)
-                })
+        # Non-dict conditions default to equality; unknown operators are skipped
+        filters = [
+            _where_operand(field, _WHERE_OPERATORS[op], value, self._value_keys.get(field))
+            for field, condition in filter_dict.items()
+            for op, value in (condition.items() if isinstance(condition, dict) else (("eq", condition),))
+            if op in _WHERE_OPERATORS
+        ]
         
         if len(filters) == 1:
             return filters[0]
@@ -362,24 +719,16 @@ class WeaviateVectorStore:
             memory_id: ID of deprecated memory
             superseded_by: ID of new memory that replaces it
         """
-        # Update with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                self.client.data_object.update(
-                    uuid=memory_id,
-                    class_name=self.class_name,
-                    data_object={
-                        "status": "deprecated",
-                        "superseded_by": superseded_by
-                    }
-                )
-                return
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Weaviate update failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        await self._with_retry(
+            "update", self.client.data_object.update,
+            uuid=memory_id,
+            class_name=self.class_name,
+            data_object={
+                "status": "deprecated",
+                "superseded_by": superseded_by
+            }
+        )
+        self._invalidate_query_cache()
     
     async def delete_memory(self, memory_id: str) -> None:
         """
@@ -388,30 +737,98 @@ class WeaviateVectorStore:
         Args:
             memory_id: ID of memory to delete
         """
-        # Delete with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                self.client.data_object.delete(
-                    uuid=memory_id,
-                    class_name=self.class_name
-                )
-                return
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Weaviate delete failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        await self._with_retry(
+            "delete", self.client.data_object.delete,
+            uuid=memory_id,
+            class_name=self.class_name
+        )
+        self._invalidate_query_cache()
+    
+    async def delete_memories_batch(self, memory_ids: List[str]) -> None:
+        """
+        Delete multiple memories from the store.
+        
+        IDs are matched server-side by a batch delete, in slices of up to
+        MAX_DELETE_OBJECTS, instead of one request per memory.
+        
+        Args:
+            memory_ids: IDs of memories to delete
+        """
+        if not memory_ids:
+            return
+        
+        try:
+            for i in range(0, len(memory_ids), self.MAX_DELETE_OBJECTS):
+                await self._delete_matching({
+                    "path": ["id"],
+                    "operator": "ContainsAny",
+                    "valueTextArray": memory_ids[i:i + self.MAX_DELETE_OBJECTS]
+                })
+        finally:
+            self._invalidate_query_cache()
+    
+    async def delete_where(self, filter_dict: Dict[str, Any]) -> int:
+        """
+        Delete every memory matching a metadata filter.
+        
+        Args:
+            filter_dict: Metadata filters, as accepted by search
+            
+        Returns:
+            Number of memories deleted
+            
+        Raises:
+            ValueError: If the filter is empty
+        """
+        where_filter = self._build_where_filter(filter_dict)
+        if not where_filter:
+            raise ValueError("delete_where requires a non-empty filter")
+        
+        try:
+            return await self._delete_matching(where_filter)
+        finally:
+            self._invalidate_query_cache()
+    
+    async def _delete_matching(self, where_filter: Dict[str, Any]) -> int:
+        """
+        Batch delete every object matching a where filter.
+        
+        Each request removes at most the server's QUERY_MAXIMUM_RESULTS
+        matches, which may be configured below MAX_DELETE_OBJECTS, so
+        requests repeat until one deletes nothing.
+        
+        Args:
+            where_filter: Weaviate where filter
+            
+        Returns:
+            Number of objects deleted
+        """
+        deleted = 0
+        while True:
+            result = await self._with_retry(
+                "batch delete", self.client.batch.delete_objects,
+                class_name=self.class_name,
+                where=where_filter,
+                output="minimal",
+                dry_run=False
+            )
+            successful = ((result or {}).get("results") or {}).get("successful", 0)
+            if not successful:
+                return deleted
+            deleted += successful
     
     async def get_stats(self) -> Dict[str, Any]:
         """
         Get index statistics.
         
+        The class schema is cached for SCHEMA_CACHE_TTL seconds so frequent
+        polling does not fetch it from Weaviate on every call.
+        
         Returns:
             Dictionary with index statistics
         """
         try:
-            schema = self.client.schema.get(self.class_name)
+            schema = await self._run_blocking(self._cached_schema)
             return {
                 "class": self.class_name,
                 "properties": len(schema.get("properties", [])),
@@ -423,7 +840,8 @@ class WeaviateVectorStore:
             return {}
     
     async def hybrid_search(self, query: str, query_vector: List[float], 
-                           alpha: float = 0.5, top_k: int = 5) -> List[MemoryChunk]:
+                           alpha: float = 0.5, top_k: int = 5,
+                           fields: Optional[Sequence[str]] = None) -> List[MemoryChunk]:
         """
         Perform hybrid search combining keyword and vector search.
         
@@ -432,24 +850,17 @@ class WeaviateVectorStore:
             query_vector: Vector for similarity search
             alpha: Weight between keyword (0) and vector (1) search
             top_k: Number of results to return
+            fields: Properties to fetch (defaults to DEFAULT_FIELDS)
             
         Returns:
             List of hybrid search results
         """
         # Build hybrid query
+        properties = list(fields or self.DEFAULT_FIELDS)
+        properties.append("_additional {id score}")
         hybrid_query = (
             self.client.query
-            .get(self.class_name, [
-                "content",
-                "agent_id",
-                "task_id",
-                "file_path",
-                "timestamp",
-                "utility_score",
-                "status",
-                "superseded_by",
-                "_additional {id score}"
-            ])
+            .get(self.class_name, properties)
             .with_hybrid(
                 query=query,
                 vector=query_vector,
@@ -458,37 +869,40 @@ class WeaviateVectorStore:
             .with_limit(top_k)
         )
         
-        # Execute with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                result = hybrid_query.do()
-                break
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                logger.warning(f"Weaviate hybrid search failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(self.retry_delay * (2 ** attempt))
-        
-        # Convert results to MemoryChunk objects
-        memories = []
-        if result and "data" in result and "Get" in result["data"]:
-            for item in result["data"]["Get"][self.class_name]:
-                memory = MemoryChunk(
-                    id=item["_additional"]["id"],
-                    content=item["content"],
-                    agent_id=item["agent_id"],
-                    task_id=item.get("task_id") or None,
-                    file_path=item.get("file_path") or None,
-                    timestamp=datetime.fromisoformat(item["timestamp"]),
-                    utility_score=item["utility_score"],
-                    vector=query_vector,  # Store query vector for reference
-                    status=item["status"],
-                    superseded_by=item.get("superseded_by") or None
-                )
-                memories.append(memory)
+        result = await self._with_retry("hybrid search", hybrid_query.do)
         
-        return memories
+        return self._to_memories(result, query_vector)
+    
+    def _to_memories(self, result: Optional[Dict[str, Any]], query_vector: List[float]) -> List[MemoryChunk]:
+        """
+        Convert a GraphQL Get response to memory chunks.
+        
+        Args:
+            result: Raw query response
+            query_vector: Query embedding vector
+            
+        Returns:
+            List of memory chunks
+        """
+        data = (result or {}).get("data") or {}
+        items = (data.get("Get") or {}).get(self.class_name) or []
+        
+        # Properties outside the requested projection are absent from items
+        return [
+            MemoryChunk(
+                id=item["_additional"]["id"],
+                content=item.get("content") or "",
+                agent_id=item.get("agent_id") or "",
+                task_id=item.get("task_id") or None,
+                file_path=item.get("file_path") or None,
+                timestamp=datetime.fromisoformat(item["timestamp"]) if item.get("timestamp") else _EPOCH,
+                utility_score=item.get("utility_score") or 0.0,
+                vector=query_vector,  # Store query vector for reference
+                status=item.get("status") or "active",
+                superseded_by=item.get("superseded_by") or None
+            )
+            for item in items
+        ]
 
 
 def create_weaviate_store(config: Dict[str, Any]) -> WeaviateVectorStore:
@@ -7,23 +7,32 @@ Provides comprehensive monitoring, metrics collection, and observability
 for the APEX Agent Payroll System.
 """
 
-# Import components with lazy loading to avoid circular dependencies
-def _lazy_import(module_name, item_name):
-    """Lazy import helper to avoid circular dependencies."""
-    def _import():
-        module = __import__(module_name, fromlist=[item_name])
-        return getattr(module, item_name)
-    return _import
+import importlib
+
+# Exported names and the submodules that define them; each submodule is
+# imported on first access to avoid circular dependencies
+_LAZY_IMPORTS = {
+    'MetricsCollector': '.metrics',
+    'MetricsType': '.metrics',
+    'StructuredLogger': '.logging',
+    'TracingManager': '.tracing',
+    'HealthChecker': '.health',
+    'HealthStatus': '.health',
+    'AlertManager': '.alerts',
+    'AlertSeverity': '.alerts',
+}
+
+
+def __getattr__(name):
+    """Import a lazily exported name on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# Lazy imports
-MetricsCollector = _lazy_import('.metrics', 'MetricsCollector')
-MetricsType = _lazy_import('.metrics', 'MetricsType')
-StructuredLogger = _lazy_import('.logging', 'StructuredLogger')
-TracingManager = _lazy_import('.tracing', 'TracingManager')
-HealthChecker = _lazy_import('.health', 'HealthChecker')
-HealthStatus = _lazy_import('.health', 'HealthStatus')
-AlertManager = _lazy_import('.alerts', 'AlertManager')
-AlertSeverity = _lazy_import('.alerts', 'AlertSeverity')
 
 __all__ = [
     'MetricsCollector',
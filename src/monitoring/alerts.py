@@ -18,6 +18,8 @@ from enum import Enum
 from typing import Dict, List, Optional, Any, Callable
 import logging
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +85,10 @@ class AlertChannel(ABC):
             True if sent successfully, False otherwise
         """
         pass
+    
+    async def aclose(self) -> None:
+        """Release resources held by this channel."""
+        pass
 
 
 class LogAlertChannel(AlertChannel):
@@ -213,25 +219,77 @@ class EmailAlertChannel(AlertChannel):
         """
 
 
-class WebhookAlertChannel(AlertChannel):
+class HTTPAlertChannel(AlertChannel):
+    """
+    Base class for channels that post alerts over HTTP.
+    
+    Keeps one pooled client so repeated alerts reuse keep-alive connections
+    instead of a new TLS handshake each time.
+    """
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize HTTP alert channel.
+        
+        Args:
+            client: HTTP client to send with; it is left open for its owner
+                to close. When omitted the channel creates and owns one.
+        """
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client for the running event loop.
+        
+        Pooled connections belong to the loop that opened them, so an owned
+        client is replaced when alerts are sent from a different loop.
+        """
+        if not self._owns_client:
+            return self._client
+        
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+                timeout=10.0
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this channel created it."""
+        if not self._owns_client or self._client is None:
+            return
+        
+        client, self._client = self._client, None
+        # A client from an earlier loop cannot be closed from this one; its
+        # connections went away with that loop
+        if self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+
+
+class WebhookAlertChannel(HTTPAlertChannel):
     """Webhook-based alert channel."""
     
-    def __init__(self, webhook_url: str, headers: Dict[str, str] = None):
+    def __init__(self, webhook_url: str, headers: Dict[str, str] = None,
+                 client: Optional[httpx.AsyncClient] = None):
         """
         Initialize webhook alert channel.
         
         Args:
             webhook_url: Webhook URL
             headers: HTTP headers to send with webhook
+            client: HTTP client to send with (defaults to one owned by the channel)
         """
+        super().__init__(client)
         self.webhook_url = webhook_url
         self.headers = headers or {}
     
     async def send_alert(self, alert: Alert) -> bool:
         """Send alert via webhook."""
         try:
-            import httpx
-            
             # Prepare payload
             payload = {
                 "alert_id": alert.id,
@@ -247,14 +305,13 @@ class WebhookAlertChannel(AlertChannel):
             }
             
             # Send webhook
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers=self.headers,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                self.webhook_url,
+                json=payload,
+                headers=self.headers,
+                timeout=10.0
+            )
+            response.raise_for_status()
             
             logger.info(f"Alert webhook sent: {alert.id}")
             return True
@@ -263,25 +320,26 @@ class WebhookAlertChannel(AlertChannel):
             return False
 
 
-class SlackAlertChannel(AlertChannel):
+class SlackAlertChannel(HTTPAlertChannel):
     """Slack-based alert channel."""
     
-    def __init__(self, webhook_url: str, channel: str = None):
+    def __init__(self, webhook_url: str, channel: str = None,
+                 client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Slack alert channel.
         
         Args:
             webhook_url: Slack webhook URL
             channel: Slack channel (optional, overrides webhook default)
+            client: HTTP client to send with (defaults to one owned by the channel)
         """
+        super().__init__(client)
         self.webhook_url = webhook_url
         self.channel = channel
     
     async def send_alert(self, alert: Alert) -> bool:
         """Send alert to Slack."""
         try:
-            import httpx
-            
             # Determine color based on severity
             color = {
                 AlertSeverity.LOW: "good",
@@ -314,13 +372,12 @@ class SlackAlertChannel(AlertChannel):
                 payload["channel"] = self.channel
             
             # Send to Slack
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=10.0
-                )
-                response.raise_for_status()
+            response = await self._get_client().post(
+                self.webhook_url,
+                json=payload,
+                timeout=10.0
+            )
+            response.raise_for_status()
             
             logger.info(f"Alert sent to Slack: {alert.id}")
             return True
@@ -513,6 +570,11 @@ class AlertManager:
     def get_alert(self, alert_id: str) -> Optional[Alert]:
         """Get alert by ID."""
         return self._alerts.get(alert_id)
+    
+    async def aclose(self) -> None:
+        """Release resources held by this manager's channels."""
+        for channel in self._channels:
+            await channel.aclose()
 
 
 # Global alert manager instance
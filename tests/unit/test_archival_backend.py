@@ -0,0 +1,181 @@
+"""
+Unit Tests for Archival Storage Index Log
+Module ID: APEX-TEST-ARCHIVAL-001
+Version: 0.1.0
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from src.memory.backends.archival import (
+    ArchivalConfig,
+    ArchivalMetadata,
+    ArchivalStatus,
+    ArchivalStorage,
+    CompressionType,
+    _metadata_to_dict,
+)
+
+
+def _log_records(storage):
+    """Parse every line of the storage's index log."""
+    with open(storage._index_log_path, 'r') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.unit
+class TestArchivalIndexLog:
+    """Test cases for the append-only archival index log."""
+    
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Archival configuration rooted in a temporary directory."""
+        return ArchivalConfig(base_path=str(tmp_path / "archival"))
+    
+    @pytest.fixture
+    def storage(self, config):
+        """Create archival storage instance."""
+        return ArchivalStorage(config)
+    
+    async def test_store_and_delete_append_records(self, storage):
+        """Test that each change appends one record to the log."""
+        first = await storage.store("item-1", {"value": 1}, tags=["a"])
+        second = await storage.store("item-2", {"value": 2}, tags=["b"])
+        await storage.delete(first)
+        
+        records = _log_records(storage)
+        assert [r["op"] for r in records] == ["put", "put", "put", "del"]
+        assert records[1]["meta"]["id"] == second
+        assert records[-1] == {"op": "del", "id": first}
+    
+    async def test_replay_restores_index(self, storage, config):
+        """Test that reopening the storage replays puts and deletes."""
+        kept = await storage.store("item-1", {"value": 1}, tags=["keep"])
+        dropped = await storage.store("item-2", {"value": 2}, tags=["drop"])
+        await storage.delete(dropped)
+        
+        reopened = ArchivalStorage(config)
+        
+        assert list(reopened._index) == [kept]
+        metadata = reopened._index[kept]
+        assert metadata.original_id == "item-1"
+        assert metadata.status is ArchivalStatus.ARCHIVED
+        assert isinstance(metadata.timestamp, datetime)
+        assert list(reopened._tag_index["keep"]) == [kept]
+        assert await reopened.retrieve(kept) == {"value": 1}
+    
+    async def test_replay_applies_latest_put(self, storage, config):
+        """Test that a later put for the same item wins on replay."""
+        archival_id = await storage.store("item-1", {"value": 1})
+        await storage.retrieve(archival_id)
+        await storage.retrieve(archival_id)
+        
+        reopened = ArchivalStorage(config)
+        
+        assert reopened._index[archival_id].access_count == 2
+    
+    async def test_corrupt_line_skipped(self, storage, config):
+        """Test that a torn line is skipped and later records still apply."""
+        first = await storage.store("item-1", {"value": 1})
+        with open(storage._index_log_path, 'a') as f:
+            f.write('{"op": "put", "meta": {"id": \n')
+        second = await storage.store("item-2", {"value": 2})
+        
+        reopened = ArchivalStorage(config)
+        
+        assert set(reopened._index) == {first, second}
+        # The damaged log is rewritten, so every line parses again
+        records = _log_records(reopened)
+        assert sorted(r["meta"]["id"] for r in records) == sorted([first, second])
+        assert reopened._index_log_lines == 2
+    
+    async def test_log_compacts_when_grown(self, storage, config, monkeypatch):
+        """Test that the log is rewritten once it exceeds twice the live size."""
+        monkeypatch.setattr(ArchivalStorage, "INDEX_LOG_MIN_COMPACT_LINES", 2)
+        archival_id = await storage.store("item-1", {"value": 1})
+        for _ in range(10):
+            await storage.retrieve(archival_id)
+        
+        assert storage._index_log_lines <= 4
+        assert len(_log_records(storage)) == storage._index_log_lines
+        
+        reopened = ArchivalStorage(config)
+        assert reopened._index[archival_id].access_count == 10
+    
+    async def test_save_index_compacts_to_live_items(self, storage):
+        """Test that save_index leaves one put record per live item."""
+        first = await storage.store("item-1", {"value": 1})
+        second = await storage.store("item-2", {"value": 2})
+        await storage.retrieve(first)
+        await storage.delete(second)
+        
+        await storage.save_index()
+        
+        records = _log_records(storage)
+        assert records == [{"op": "put", "meta": records[0]["meta"]}]
+        assert records[0]["meta"]["id"] == first
+        assert storage._index_log_lines == 1
+    
+    async def test_legacy_index_migrated(self, config):
+        """Test that a legacy archival_index.json snapshot is migrated."""
+        metadata = ArchivalMetadata(
+            id="legacy-1",
+            original_id="item-1",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            status=ArchivalStatus.ARCHIVED,
+            compression_type=CompressionType.GZIP,
+            size_bytes=10,
+            tags=["old"]
+        )
+        legacy_record = _metadata_to_dict(metadata)
+        # Older snapshots stored enums as "Class.MEMBER"
+        legacy_record["status"] = "ArchivalStatus.ARCHIVED"
+        legacy_record["compression_type"] = "CompressionType.GZIP"
+        
+        index_dir = ArchivalStorage(config).base_path / "index"
+        with open(index_dir / "archival_index.json", 'w') as f:
+            json.dump([legacy_record], f, default=str)
+        
+        storage = ArchivalStorage(config)
+        
+        loaded = storage._index["legacy-1"]
+        assert loaded.timestamp == datetime(2024, 1, 1, 12, 0, 0)
+        assert loaded.compression_type is CompressionType.GZIP
+        assert list(storage._tag_index["old"]) == ["legacy-1"]
+        records = _log_records(storage)
+        assert [(r["op"], r["meta"]["id"]) for r in records] == [("put", "legacy-1")]
+        
+        # Once the log exists the legacy snapshot is no longer read
+        (index_dir / "archival_index.json").unlink()
+        assert list(ArchivalStorage(config)._index) == ["legacy-1"]
+    
+    async def test_index_disabled_writes_no_log(self, tmp_path):
+        """Test that no log is written when the index is disabled."""
+        storage = ArchivalStorage(ArchivalConfig(
+            base_path=str(tmp_path / "archival"),
+            index_enabled=False
+        ))
+        archival_id = await storage.store("item-1", {"value": 1})
+        
+        assert not storage._index_log_path.exists()
+        assert await storage.retrieve(archival_id) == {"value": 1}
+    
+    def test_concurrent_stores_under_fresh_loops(self, config):
+        """Test that concurrent stores log every record under a new event loop."""
+        storage = ArchivalStorage(config)
+        
+        async def store_pair(prefix):
+            return await asyncio.gather(
+                storage.store(f"{prefix}-1", {"value": 1}),
+                storage.store(f"{prefix}-2", {"value": 2})
+            )
+        
+        # The storage outlives each loop, as the module-level instance does
+        first = asyncio.run(store_pair("a"))
+        second = asyncio.run(store_pair("b"))
+        
+        records = _log_records(storage)
+        assert sorted(r["meta"]["id"] for r in records) == sorted(first + second)
+        assert set(ArchivalStorage(config)._index) == set(first + second)
@@ -0,0 +1,259 @@
+"""
+Unit Tests for MCP Server
+Module ID: APEX-TEST-MCP-001
+Version: 0.1.0
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from src.mcp.server import MCPServer, Tool
+
+
+@pytest.fixture
+def server():
+    """Create an MCP server with a sync and an async test tool."""
+    server = MCPServer()
+    
+    async def sleep_tool(arguments):
+        await asyncio.sleep(arguments["delay"])
+        return arguments["value"]
+    
+    server.tool_registry.register_tool(Tool(
+        name="echo",
+        description="Echo the arguments",
+        input_schema={"type": "object"},
+        handler=lambda arguments: arguments,
+        category="test"
+    ))
+    server.tool_registry.register_tool(Tool(
+        name="sleep",
+        description="Sleep, then return a value",
+        input_schema={"type": "object"},
+        handler=sleep_tool,
+        category="test",
+        async_handler=True
+    ))
+    return server
+
+
+def _call(tool_name, **arguments):
+    """Build a tools/call request."""
+    return {
+        "method": "tools/call",
+        "params": {"tool_name": tool_name, "arguments": arguments}
+    }
+
+
+@pytest.mark.unit
+class TestMCPServerBatch:
+    """Test cases for batched MCP requests."""
+    
+    async def test_batch_preserves_order(self, server):
+        """Test that responses come back in request order, not completion order."""
+        batch = [
+            _call("sleep", delay=0.05, value="slow"),
+            _call("sleep", delay=0.0, value="fast"),
+            _call("echo", value="sync"),
+        ]
+        responses = await server.handle_request(batch)
+        
+        assert [r["result"] for r in responses] == ["slow", "fast", {"value": "sync"}]
+    
+    async def test_batch_runs_concurrently(self, server):
+        """Test that batch sub-requests are dispatched concurrently."""
+        batch = [_call("sleep", delay=0.1, value=i) for i in range(5)]
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        responses = await server.handle_request(batch)
+        
+        assert loop.time() - started < 0.4
+        assert [r["result"] for r in responses] == list(range(5))
+    
+    async def test_empty_batch_is_error(self, server):
+        """Test that an empty batch returns a single error response."""
+        response = await server.handle_request([])
+        
+        assert response == {"error": "Empty batch"}
+    
+    async def test_non_dict_items_fail_individually(self, server):
+        """Test that a malformed item fails without affecting its neighbours."""
+        batch = [
+            _call("echo", value=1),
+            42,
+            "tools/list",
+            {"method": "no/such/method"},
+            _call("echo", value=2),
+        ]
+        responses = await server.handle_request(batch)
+        
+        assert len(responses) == 5
+        assert responses[0]["result"] == {"value": 1}
+        assert "error" in responses[1]
+        assert "error" in responses[2]
+        assert responses[3] == {"error": "Unknown method: no/such/method"}
+        assert responses[4]["result"] == {"value": 2}
+    
+    async def test_single_request_not_wrapped(self, server):
+        """Test that a plain request returns a plain response."""
+        response = await server.handle_request(_call("echo", value=1))
+        
+        assert isinstance(response, dict)
+        assert response["status"] == "completed"
+
+
+@pytest.mark.unit
+class TestMCPServerExecutionHistory:
+    """Test cases for the bounded execution history."""
+    
+    async def test_oldest_executions_evicted(self):
+        """Test that the oldest records are dropped once over max_executions."""
+        server = MCPServer(max_executions=3)
+        
+        execution_ids = []
+        for i in range(5):
+            response = await server.handle_request({
+                "method": "tools/call",
+                "params": {"tool_name": "list_tools", "arguments": {}}
+            })
+            assert response["status"] == "completed"
+            execution_ids.append(response["execution_id"])
+        
+        assert list(server._executions) == execution_ids[2:]
+        for execution_id in execution_ids[:2]:
+            status = await server.handle_request({
+                "method": "execution/status",
+                "params": {"execution_id": execution_id}
+            })
+            assert status == {"error": f"Execution not found: {execution_id}"}
+    
+    async def test_failed_lookups_count_towards_limit(self):
+        """Test that executions for unknown tools are also bounded."""
+        server = MCPServer(max_executions=2)
+        
+        for _ in range(4):
+            response = await server.handle_request(_call("missing"))
+            assert response["status"] == "failed"
+        
+        assert len(server._executions) == 2
+    
+    async def test_running_execution_evicted_still_completes(self, server):
+        """Test that a call evicted while running still returns its result."""
+        server.max_executions = 1
+        
+        call = asyncio.ensure_future(
+            server.handle_request(_call("sleep", delay=0.05, value="done"))
+        )
+        await asyncio.sleep(0.01)
+        newer = await server.handle_request(_call("echo", value=1))
+        
+        response = await call
+        
+        assert response["status"] == "completed"
+        assert response["result"] == "done"
+        assert list(server._executions) == [newer["execution_id"]]
+
+
+@pytest.mark.unit
+class TestMCPServerCleanup:
+    """Test cases for cleanup_executions."""
+    
+    HOUR_NS = 3600 * 1_000_000_000
+    
+    async def _executions(self, server, count):
+        """Run the echo tool count times and return the execution records."""
+        executions = []
+        for i in range(count):
+            response = await server.handle_request(_call("echo", value=i))
+            executions.append(server._executions[response["execution_id"]])
+        return executions
+    
+    async def test_removes_only_expired(self, server):
+        """Test that executions older than max_age_hours are removed."""
+        oldest, old, fresh = await self._executions(server, 3)
+        oldest.started_at_ns -= 3 * self.HOUR_NS
+        old.started_at_ns -= 2 * self.HOUR_NS
+        
+        assert server.cleanup_executions(max_age_hours=1.0) == 2
+        assert list(server._executions) == [fresh.id]
+    
+    async def test_nothing_expired(self, server):
+        """Test that a fresh history is left untouched."""
+        executions = await self._executions(server, 3)
+        
+        assert server.cleanup_executions(max_age_hours=1.0) == 0
+        assert list(server._executions) == [e.id for e in executions]
+    
+    async def test_scan_stops_at_first_unexpired(self, server):
+        """Test that the scan stops at the first execution inside the window."""
+        first, second, third = await self._executions(server, 3)
+        first.started_at_ns -= 2 * self.HOUR_NS
+        # Out of start order: not reached, since the scan relies on
+        # insertion order matching start order
+        third.started_at_ns -= 2 * self.HOUR_NS
+        
+        assert server.cleanup_executions(max_age_hours=1.0) == 1
+        assert list(server._executions) == [second.id, third.id]
+    
+    async def test_unstarted_executions_skipped(self, server):
+        """Test that executions that never started neither block nor get removed."""
+        (before,) = await self._executions(server, 1)
+        before.started_at_ns -= 2 * self.HOUR_NS
+        missing = await server.handle_request(_call("missing"))
+        (after,) = await self._executions(server, 1)
+        after.started_at_ns -= 2 * self.HOUR_NS
+        
+        assert server.cleanup_executions(max_age_hours=1.0) == 2
+        assert list(server._executions) == [missing["execution_id"]]
+    
+    async def test_cancels_running_task(self, server):
+        """Test that an expired running execution has its task cancelled."""
+        call = asyncio.ensure_future(
+            server.handle_request(_call("sleep", delay=10, value=None))
+        )
+        await asyncio.sleep(0.01)
+        (execution,) = server._executions.values()
+        execution.started_at_ns -= 2 * self.HOUR_NS
+        
+        assert server.cleanup_executions(max_age_hours=1.0) == 1
+        assert execution.id not in server._running_tasks
+        
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+
+@pytest.mark.unit
+class TestMCPServerTimestamps:
+    """Test cases for execution timestamps."""
+    
+    async def test_status_reports_wall_clock_times(self, server):
+        """Test that execution/status reports UTC start and completion times."""
+        before = datetime.utcnow()
+        response = await server.handle_request(_call("sleep", delay=0.02, value=None))
+        after = datetime.utcnow()
+        
+        status = await server.handle_request({
+            "method": "execution/status",
+            "params": {"execution_id": response["execution_id"]}
+        })
+        started = datetime.fromisoformat(status["started_at"])
+        completed = datetime.fromisoformat(status["completed_at"])
+        
+        slack = timedelta(milliseconds=5)
+        assert before - slack <= started <= completed <= after + slack
+        assert (completed - started).total_seconds() == pytest.approx(status["duration"], abs=1e-3)
+        assert status["duration"] >= 0.02
+    
+    async def test_unstarted_execution_reports_completion_only(self, server):
+        """Test that a failed lookup has a completion time but no start time."""
+        response = await server.handle_request(_call("missing"))
+        
+        status = await server.handle_request({
+            "method": "execution/status",
+            "params": {"execution_id": response["execution_id"]}
+        })
+        
+        assert status["started_at"] is None
+        assert isinstance(datetime.fromisoformat(status["completed_at"]), datetime)
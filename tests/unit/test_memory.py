@@ -0,0 +1,383 @@
+"""
+Unit Tests for Semantic Memory
+Module ID: APEX-TEST-MEMORY-001
+Version: 0.1.0
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+import src.memory as memory
+from src.memory import FAISS_AVAILABLE, MemoryChunk, SemanticSieve, VectorStore
+
+
+def _chunk(memory_id, vector, status="active", content=""):
+    """Build a memory chunk with the given embedding."""
+    return MemoryChunk(
+        id=memory_id,
+        content=content,
+        agent_id="agent-1",
+        task_id=None,
+        file_path=None,
+        timestamp=datetime(2025, 1, 1),
+        utility_score=0.5,
+        vector=vector,
+        status=status
+    )
+
+
+def _ids(chunks):
+    """Ids of a list of chunks, in order."""
+    return [chunk.id for chunk in chunks]
+
+
+@pytest.mark.unit
+class TestVectorStore:
+    """Test cases for the matrix-backed VectorStore search."""
+    
+    @pytest.fixture
+    def store(self):
+        """Create a vector store using exact search."""
+        return VectorStore(backend="chromadb")
+    
+    async def test_empty_store_returns_nothing(self, store):
+        """Test that searching an empty store returns no results."""
+        assert await store.search([1.0, 0.0]) == []
+    
+    async def test_results_ordered_by_similarity(self, store):
+        """Test that results are ordered by cosine similarity, best first."""
+        await store.add_memory(_chunk("far", [0.0, 1.0]))
+        await store.add_memory(_chunk("near", [1.0, 0.1]))
+        await store.add_memory(_chunk("exact", [2.0, 0.0]))
+        await store.add_memory(_chunk("mid", [1.0, 0.5]))
+        
+        results = await store.search([1.0, 0.0], top_k=5, min_similarity=0.0)
+        
+        assert _ids(results) == ["exact", "near", "mid", "far"]
+    
+    async def test_top_k_limits_results(self, store):
+        """Test that only the top_k best matches are returned."""
+        for i in range(10):
+            await store.add_memory(_chunk(f"m{i}", [1.0, i / 10]))
+        
+        results = await store.search([1.0, 0.0], top_k=3, min_similarity=0.0)
+        
+        assert _ids(results) == ["m0", "m1", "m2"]
+        assert await store.search([1.0, 0.0], top_k=0) == []
+    
+    async def test_ties_keep_insertion_order(self, store):
+        """Test that equal scores are returned in insertion order."""
+        for memory_id in ("b", "a", "c"):
+            await store.add_memory(_chunk(memory_id, [1.0, 1.0]))
+        
+        results = await store.search([1.0, 1.0], top_k=2)
+        
+        assert _ids(results) == ["b", "a"]
+    
+    async def test_min_similarity_threshold(self, store):
+        """Test that matches below min_similarity are dropped."""
+        await store.add_memory(_chunk("same", [1.0, 0.0]))
+        await store.add_memory(_chunk("close", [1.0, 0.3]))
+        await store.add_memory(_chunk("orthogonal", [0.0, 1.0]))
+        
+        assert _ids(await store.search([1.0, 0.0])) == ["same", "close"]
+        assert _ids(await store.search([1.0, 0.0], min_similarity=0.99)) == ["same"]
+    
+    async def test_deprecated_memories_masked(self, store):
+        """Test that deprecated memories are excluded from search."""
+        await store.add_memory(_chunk("old", [1.0, 0.0]))
+        await store.add_memory(_chunk("new", [1.0, 0.1]))
+        await store.add_memory(_chunk("stale", [1.0, 0.0], status="deprecated"))
+        
+        await store.deprecate_memory("old", superseded_by="new")
+        
+        assert _ids(await store.search([1.0, 0.0])) == ["new"]
+        assert store.memories["old"].status == "deprecated"
+        assert store.memories["old"].superseded_by == "new"
+    
+    async def test_dimension_mismatch_never_matches(self, store):
+        """Test that vectors of another dimension are stored but not searched."""
+        await store.add_memory(_chunk("2d", [1.0, 0.0]))
+        await store.add_memory(_chunk("3d", [1.0, 0.0, 0.0]))
+        await store.add_memory(_chunk("none", None))
+        
+        assert set(store.memories) == {"2d", "3d", "none"}
+        assert _ids(await store.search([1.0, 0.0], min_similarity=-1.0)) == ["2d"]
+        assert await store.search([1.0, 0.0, 0.0]) == []
+    
+    async def test_zero_query_returns_nothing(self, store):
+        """Test that a zero query vector matches nothing."""
+        await store.add_memory(_chunk("m", [1.0, 0.0]))
+        
+        assert await store.search([0.0, 0.0], min_similarity=-1.0) == []
+    
+    async def test_matrix_grows_past_initial_capacity(self, store):
+        """Test that the matrix grows and keeps earlier rows intact."""
+        count = VectorStore.INITIAL_CAPACITY * 2 + 1
+        for i in range(count):
+            await store.add_memory(_chunk(f"m{i}", [1.0, float(i)]))
+        await store.deprecate_memory("m1", superseded_by="m2")
+        
+        assert store._matrix.shape[0] >= count
+        assert store._size == count
+        assert _ids(await store.search([1.0, 0.0], top_k=2, min_similarity=-1.0)) == ["m0", "m2"]
+        assert _ids(await store.search([0.0, 1.0], top_k=1)) == [f"m{count - 1}"]
+    
+    async def test_readding_id_replaces_vector(self, store):
+        """Test that re-adding an id updates its row in place."""
+        await store.add_memory(_chunk("m", [1.0, 0.0]))
+        await store.add_memory(_chunk("m", [0.0, 1.0]))
+        
+        assert store._size == 1
+        assert await store.search([1.0, 0.0]) == []
+        assert _ids(await store.search([0.0, 1.0])) == ["m"]
+
+
+@pytest.mark.unit
+class TestVectorStoreHNSW:
+    """Test cases for the FAISS HNSW candidate search."""
+    
+    DIMENSION = 32
+    
+    @pytest.fixture
+    def vectors(self):
+        """Random embeddings for a small corpus."""
+        rng = np.random.default_rng(0)
+        return rng.standard_normal((200, self.DIMENSION)).astype(np.float32)
+    
+    async def _fill(self, store, vectors):
+        """Add one memory per vector."""
+        for i, vector in enumerate(vectors):
+            await store.add_memory(_chunk(f"m{i}", vector.tolist()))
+    
+    def test_falls_back_without_faiss(self, monkeypatch):
+        """Test that the faiss backend uses exact search when faiss is missing."""
+        monkeypatch.setattr(memory, "FAISS_AVAILABLE", False)
+        
+        store = VectorStore(backend="faiss")
+        
+        assert store._use_hnsw is False
+    
+    async def test_exact_backend_builds_no_graph(self, vectors):
+        """Test that other backends never build an HNSW graph."""
+        store = VectorStore(backend="chromadb")
+        await self._fill(store, vectors[:10])
+        
+        assert store._hnsw is None
+    
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+    async def test_matches_exact_search(self, vectors):
+        """Test that HNSW results match exact search on a small corpus."""
+        exact = VectorStore(backend="chromadb")
+        hnsw = VectorStore(backend="faiss")
+        await self._fill(exact, vectors)
+        await self._fill(hnsw, vectors)
+        
+        assert hnsw._hnsw.ntotal == len(vectors)
+        for query in vectors[:20]:
+            expected = await exact.search(query.tolist(), top_k=5, min_similarity=-1.0)
+            actual = await hnsw.search(query.tolist(), top_k=5, min_similarity=-1.0)
+            assert _ids(actual) == _ids(expected)
+    
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+    async def test_deprecated_rows_masked(self, vectors):
+        """Test that deprecated rows proposed by the graph are filtered out."""
+        store = VectorStore(backend="faiss")
+        await self._fill(store, vectors)
+        
+        await store.deprecate_memory("m0", superseded_by="m1")
+        results = await store.search(vectors[0].tolist(), top_k=3, min_similarity=-1.0)
+        
+        assert "m0" not in _ids(results)
+        assert len(results) == 3
+    
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+    async def test_readded_id_rescored_with_current_vector(self, vectors):
+        """Test that a stale graph node resolves to the id's current vector."""
+        store = VectorStore(backend="faiss")
+        await self._fill(store, vectors)
+        
+        await store.add_memory(_chunk("m0", (-vectors[0]).tolist()))
+        
+        assert store._hnsw.ntotal == len(vectors) + 1
+        results = await store.search(vectors[0].tolist(), top_k=5, min_similarity=0.5)
+        assert "m0" not in _ids(results)
+        results = await store.search((-vectors[0]).tolist(), top_k=1)
+        assert _ids(results) == ["m0"]
+
+
+@pytest.mark.unit
+class TestVectorStoreRanking:
+    """Test cases for thresholding and masking ahead of top-k selection."""
+    
+    @pytest.fixture
+    def store(self):
+        """Create a vector store using exact search."""
+        return VectorStore(backend="chromadb")
+    
+    async def _fill(self, store):
+        """Add six memories of falling similarity to [1, 0]."""
+        for i in range(6):
+            await store.add_memory(_chunk(f"m{i}", [1.0, i / 10]))
+    
+    async def test_masked_rows_do_not_take_top_k_slots(self, store):
+        """Test that deprecated best matches leave room for the next best."""
+        await self._fill(store)
+        for memory_id in ("m0", "m1", "m2"):
+            await store.deprecate_memory(memory_id, superseded_by="m5")
+        
+        results = await store.search([1.0, 0.0], top_k=3)
+        
+        assert _ids(results) == ["m3", "m4", "m5"]
+    
+    async def test_fewer_survivors_than_top_k(self, store):
+        """Test that only rows over the threshold are returned."""
+        await self._fill(store)
+        results = await store.search([1.0, 0.0], top_k=5, min_similarity=0.99)
+        
+        assert _ids(results) == ["m0", "m1"]
+    
+    async def test_threshold_is_inclusive(self, store):
+        """Test that a score equal to min_similarity is kept."""
+        await self._fill(store)
+        results = await store.search([1.0, 0.0], top_k=1, min_similarity=1.0)
+        
+        assert _ids(results) == ["m0"]
+    
+    async def test_survivors_ranked_after_threshold(self, store):
+        """Test that top-k picks the best survivors in score order."""
+        await self._fill(store)
+        await store.add_memory(_chunk("best", [1.0, 0.0]))
+        
+        results = await store.search([1.0, 0.0], top_k=2, min_similarity=0.9)
+        
+        assert _ids(results) == ["m0", "best"]
+
+
+@pytest.mark.unit
+class TestVectorStoreColumns:
+    """Test cases for the row-aligned chunk column."""
+    
+    @pytest.fixture
+    def store(self):
+        """Create a vector store using exact search."""
+        return VectorStore(backend="chromadb")
+    
+    async def test_results_are_stored_chunks(self, store):
+        """Test that search returns the stored chunk objects themselves."""
+        chunk = _chunk("m", [1.0, 0.0], content="original")
+        await store.add_memory(chunk)
+        
+        (result,) = await store.search([1.0, 0.0])
+        
+        assert result is chunk
+        assert result is store.memories["m"]
+    
+    async def test_columns_stay_aligned(self, store):
+        """Test that every id maps to the row holding its chunk."""
+        for i in range(5):
+            await store.add_memory(_chunk(f"m{i}", [1.0, float(i)]))
+        await store.add_memory(_chunk("m2", [0.0, 1.0]))
+        
+        assert len(store._chunks) == store._size == 5
+        for memory_id, row in store._rows.items():
+            assert store._chunks[row] is store.memories[memory_id]
+    
+    async def test_readding_id_refreshes_chunk(self, store):
+        """Test that re-adding an id returns the new chunk from its row."""
+        await store.add_memory(_chunk("m", [1.0, 0.0], content="old"))
+        await store.add_memory(_chunk("m", [1.0, 0.0], content="new"))
+        
+        (result,) = await store.search([1.0, 0.0])
+        
+        assert result.content == "new"
+        assert result is store.memories["m"]
+    
+    async def test_readding_without_vector_masks_row(self, store):
+        """Test that a re-added id without a vector leaves search until re-embedded."""
+        await store.add_memory(_chunk("m", [1.0, 0.0]))
+        await store.add_memory(_chunk("m", None, content="pending"))
+        
+        assert await store.search([1.0, 0.0]) == []
+        assert store.memories["m"].content == "pending"
+        
+        await store.add_memory(_chunk("m", [1.0, 0.0], content="embedded"))
+        
+        (result,) = await store.search([1.0, 0.0])
+        assert result.content == "embedded"
+        assert store._size == 1
+
+
+@pytest.mark.unit
+class TestChunkText:
+    """Test cases for SemanticSieve.chunk_text boundaries."""
+    
+    @pytest.fixture
+    def sieve(self):
+        """Create semantic sieve instance."""
+        return SemanticSieve()
+    
+    def _text(self, length):
+        """Text of the given length, cycling through the alphabet."""
+        return "".join(chr(ord("a") + i % 26) for i in range(length))
+    
+    def test_short_text_single_chunk(self, sieve):
+        """Test that text within one chunk is returned whole."""
+        assert sieve.chunk_text("short", chunk_size=10, overlap=2) == ["short"]
+        
+        text = self._text(40)
+        assert sieve.chunk_text(text, chunk_size=10, overlap=2) == [text]
+    
+    def test_chunk_boundaries(self, sieve):
+        """Test that chunks step by size minus overlap, 4 characters per token."""
+        text = self._text(100)
+        
+        chunks = sieve.chunk_text(text, chunk_size=10, overlap=2)
+        
+        assert chunks == [text[0:40], text[32:72], text[64:100]]
+    
+    def test_no_chunk_of_pure_overlap(self, sieve):
+        """Test that splitting stops at the first chunk reaching the end."""
+        text = self._text(72)
+        
+        chunks = sieve.chunk_text(text, chunk_size=10, overlap=2)
+        
+        assert chunks == [text[0:40], text[32:72]]
+    
+    def test_chunks_overlap_and_cover_text(self, sieve):
+        """Test that neighbours share the overlap and together cover the text."""
+        text = self._text(1000)
+        
+        chunks = sieve.chunk_text(text, chunk_size=10, overlap=2)
+        
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous[-8:] == current[:8]
+        assert chunks[0] + "".join(chunk[8:] for chunk in chunks[1:]) == text
+    
+    def test_zero_overlap(self, sieve):
+        """Test that zero overlap splits into consecutive chunks."""
+        text = self._text(100)
+        
+        assert sieve.chunk_text(text, chunk_size=10, overlap=0) == [
+            text[0:40], text[40:80], text[80:100]
+        ]
+    
+    def test_default_sizes_terminate(self, sieve):
+        """Test that a long text splits with the default sizes."""
+        text = self._text(100000)
+        
+        chunks = sieve.chunk_text(text)
+        
+        assert chunks[-1].endswith(text[-10:])
+        assert len(chunks) == 28
+    
+    def test_overlap_not_smaller_than_size_rejected(self, sieve):
+        """Test that an overlap of at least chunk_size raises ValueError."""
+        text = self._text(100)
+        
+        with pytest.raises(ValueError):
+            sieve.chunk_text(text, chunk_size=10, overlap=10)
+        with pytest.raises(ValueError):
+            sieve.chunk_text(text, chunk_size=10, overlap=12)
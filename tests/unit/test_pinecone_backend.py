@@ -0,0 +1,263 @@
+"""
+Unit Tests for Pinecone Vector Store Backend
+Module ID: APEX-TEST-PINECONE-001
+Version: 0.1.0
+"""
+
+import sys
+import types
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+from src.memory.backends.pinecone import PineconeVectorStore, _is_retryable
+
+
+class _StatusError(Exception):
+    """Stand-in for a Pinecone API exception carrying an HTTP status."""
+    
+    def __init__(self, status):
+        """Record the HTTP status."""
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class _GrpcError(Exception):
+    """Stand-in for a gRPC error reporting a status code."""
+    
+    def __init__(self, name):
+        """Record the status code name."""
+        super().__init__(name)
+        self._code = types.SimpleNamespace(name=name)
+    
+    def code(self):
+        """Return the status code."""
+        return self._code
+
+
+@pytest.fixture
+def pinecone(monkeypatch):
+    """Install a stub pinecone module with an existing index."""
+    pinecone = types.ModuleType("pinecone")
+    pinecone.init = Mock()
+    pinecone.list_indexes = Mock(return_value=["apex-memory"])
+    pinecone.describe_index = Mock(return_value=types.SimpleNamespace(host="index.example"))
+    pinecone.Index = Mock()
+    monkeypatch.setitem(sys.modules, "pinecone", pinecone)
+    return pinecone
+
+
+@pytest.fixture
+def store(pinecone):
+    """Create a REST store that retries without waiting."""
+    return PineconeVectorStore({"use_grpc": False, "dimension": 4, "retry_delay": 0.0})
+
+
+def _match(memory_id, score, timestamp):
+    """Build a query match with full metadata."""
+    return {
+        "id": memory_id,
+        "score": score,
+        "metadata": {
+            "content": f"content {memory_id}",
+            "agent_id": "agent-1",
+            "task_id": "",
+            "file_path": "",
+            "timestamp": timestamp,
+            "utility_score": 0.5,
+            "status": "active",
+            "superseded_by": "",
+        }
+    }
+
+
+@pytest.mark.unit
+class TestPineconeRetry:
+    """Test cases for retry classification and the retry loop."""
+    
+    @pytest.mark.parametrize("error", [
+        ConnectionError("reset"),
+        TimeoutError("timed out"),
+        _StatusError(429),
+        _StatusError(503),
+        _GrpcError("UNAVAILABLE"),
+        _GrpcError("RESOURCE_EXHAUSTED"),
+    ])
+    def test_retryable(self, error):
+        """Test that transport failures and transient statuses are retried."""
+        assert _is_retryable(error)
+    
+    @pytest.mark.parametrize("error", [
+        ValueError("bad vector"),
+        _StatusError(400),
+        _StatusError(404),
+        _GrpcError("INVALID_ARGUMENT"),
+    ])
+    def test_not_retryable(self, error):
+        """Test that client errors fail immediately."""
+        assert not _is_retryable(error)
+    
+    async def test_zero_retries_calls_once(self, store):
+        """Test that max_retries=0 still makes exactly one call."""
+        store.max_retries = 0
+        fn = Mock(side_effect=_StatusError(503))
+        
+        with pytest.raises(_StatusError):
+            await store._with_retry("query", fn)
+        
+        assert fn.call_count == 1
+    
+    async def test_retries_transient_failures(self, store):
+        """Test that a retryable failure is retried until it succeeds."""
+        fn = Mock(side_effect=[_StatusError(429), _StatusError(503), "ok"])
+        
+        assert await store._with_retry("query", fn) == "ok"
+        assert fn.call_count == 3
+    
+    async def test_non_retryable_raises_immediately(self, store):
+        """Test that a non-retryable failure is not retried."""
+        fn = Mock(side_effect=_StatusError(400))
+        
+        with pytest.raises(_StatusError):
+            await store._with_retry("query", fn)
+        
+        assert fn.call_count == 1
+
+
+@pytest.mark.unit
+class TestPineconeResults:
+    """Test cases for converting query matches to memory chunks."""
+    
+    def test_epoch_timestamp(self):
+        """Test that epoch-second timestamps decode to UTC datetimes."""
+        (memory,) = PineconeVectorStore._to_memories(
+            {"matches": [_match("m1", 0.9, 1735689600.0)]}, 0.82
+        )
+        
+        assert memory.timestamp == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert memory.task_id is None
+        assert memory.file_path is None
+    
+    def test_legacy_iso_timestamp(self):
+        """Test that ISO timestamps written by older versions still decode."""
+        (memory,) = PineconeVectorStore._to_memories(
+            {"matches": [_match("m1", 0.9, "2025-01-01T12:30:00")]}, 0.82
+        )
+        
+        assert memory.timestamp == datetime(2025, 1, 1, 12, 30)
+    
+    def test_below_threshold_dropped(self):
+        """Test that matches under min_similarity are skipped."""
+        memories = PineconeVectorStore._to_memories(
+            {"matches": [_match("m1", 0.9, 0.0), _match("m2", 0.5, 0.0)]}, 0.82
+        )
+        
+        assert [m.id for m in memories] == ["m1"]
+
+
+@pytest.mark.unit
+class TestPineconeBatching:
+    """Test cases for request sizing and slicing."""
+    
+    def test_upsert_batch_size_capped_for_json(self, pinecone):
+        """Test that REST batches are sized to stay under MAX_UPSERT_BYTES."""
+        store = PineconeVectorStore({"use_grpc": False, "dimension": 1536, "batch_size": 200})
+        
+        expected = PineconeVectorStore.MAX_UPSERT_BYTES // (
+            1536 * PineconeVectorStore.JSON_BYTES_PER_VALUE
+        )
+        assert store.upsert_batch_size == expected < 200
+    
+    def test_upsert_batch_size_for_grpc(self, pinecone, monkeypatch):
+        """Test that the packed gRPC encoding allows the configured batch size."""
+        grpc = types.ModuleType("pinecone.grpc")
+        grpc.PineconeGRPC = Mock()
+        grpc.GRPCClientConfig = Mock()
+        monkeypatch.setitem(sys.modules, "pinecone.grpc", grpc)
+        
+        store = PineconeVectorStore({"dimension": 1536, "batch_size": 200})
+        
+        assert store.use_grpc
+        assert store.upsert_batch_size == 200
+    
+    def test_upsert_batch_size_at_least_one(self, pinecone):
+        """Test that a huge dimension still allows one vector per batch."""
+        store = PineconeVectorStore({"use_grpc": False, "dimension": 10_000_000})
+        
+        assert store.upsert_batch_size == 1
+    
+    async def test_delete_batch_slices_ids(self, store):
+        """Test that deletes are sent in slices of MAX_DELETE_IDS."""
+        memory_ids = [f"m{i}" for i in range(2500)]
+        
+        await store.delete_memories_batch(memory_ids, namespace="ns")
+        
+        calls = store.index.delete.call_args_list
+        assert [len(c.kwargs["ids"]) for c in calls] == [1000, 1000, 500]
+        assert [i for c in calls for i in c.kwargs["ids"]] == memory_ids
+        assert all(c.kwargs["namespace"] == "ns" for c in calls)
+    
+    async def test_delete_batch_empty(self, store):
+        """Test that an empty id list sends no request."""
+        await store.delete_memories_batch([])
+        
+        store.index.delete.assert_not_called()
+
+
+@pytest.mark.unit
+class TestPineconeSearch:
+    """Test cases for single and batched queries."""
+    
+    async def test_search_and_batch_send_same_query(self, store):
+        """Test that search and search_batch send the query vector unchanged."""
+        # Not exactly representable as float32, so a round-trip would change them
+        query_vector = [0.1, 0.2, 0.3, 0.4]
+        
+        def query(async_req=False, **kwargs):
+            response = {"matches": []}
+            return Mock(get=Mock(return_value=response)) if async_req else response
+        
+        store.index.query.side_effect = query
+        
+        await store.search(query_vector)
+        await store.search_batch([query_vector])
+        
+        single, batched = store.index.query.call_args_list
+        assert single.kwargs["vector"] == query_vector
+        assert batched.kwargs["vector"] == query_vector
+        batched.kwargs.pop("async_req")
+        assert single.kwargs == batched.kwargs
+
+
+@pytest.mark.unit
+class TestPineconeStats:
+    """Test cases for cached index statistics."""
+    
+    async def test_stats_cached_until_ttl(self, store):
+        """Test that stats are refetched only once the cache expires."""
+        store.index.describe_index_stats.return_value = types.SimpleNamespace(
+            dimension=4, index_fullness=0.0, total_vector_count=7, namespaces={}
+        )
+        
+        first = await store.get_stats()
+        second = await store.get_stats()
+        assert first == second
+        assert first["total_vector_count"] == 7
+        assert store.index.describe_index_stats.call_count == 1
+        
+        # Age the cache past its TTL
+        fetched_at, stats = store._stats_cache
+        store._stats_cache = (fetched_at - PineconeVectorStore.STATS_CACHE_TTL, stats)
+        await store.get_stats()
+        
+        assert store.index.describe_index_stats.call_count == 2
+    
+    async def test_cached_stats_are_copies(self, store):
+        """Test that callers cannot mutate the cached stats."""
+        store.index.describe_index_stats.return_value = types.SimpleNamespace(
+            dimension=4, index_fullness=0.0, total_vector_count=7, namespaces={}
+        )
+        
+        (await store.get_stats())["total_vector_count"] = 0
+        
+        assert (await store.get_stats())["total_vector_count"] == 7
@@ -138,6 +138,34 @@ def encode_data(data):
         assert violations[0]["type"] == "line_too_long"
         assert violations[0]["severity"] == "medium"
     
+    async def test_line_too_long_reports_line_number(self, ast_hook):
+        """Test that the offending line number is reported."""
+        code = "x = 1\ny = 2\n" + "z" * 1001 + "\n"
+        payload = {"code": code}
+        result = await ast_hook.execute(payload)
+        
+        violations = result["security_violations"]
+        assert violations[0]["type"] == "line_too_long"
+        assert violations[0]["line"] == 3
+        assert "1001" in violations[0]["description"]
+    
+    async def test_ast_node_limit_counts_every_node(self, hook_config):
+        """Test that Load/Store context nodes count towards max_ast_nodes."""
+        # 700 assignments are 3501 nodes as counted by ast.walk
+        code = "\n".join(f"a{i} = b{i}" for i in range(700))
+        assert sum(1 for _ in ast.walk(ast.parse(code))) == 3501
+        
+        hook = ASTScannerHook({**hook_config, "max_ast_nodes": 3000})
+        result = await hook.execute({"code": code})
+        
+        violations = result["security_violations"]
+        assert violations[0]["type"] == "ast_too_complex"
+        assert "3501" in violations[0]["description"]
+        
+        hook = ASTScannerHook({**hook_config, "max_ast_nodes": 3501})
+        result = await hook.execute({"code": code})
+        assert "security_violations" not in result
+    
     async def test_syntax_error_handling(self, ast_hook):
         """Test handling of syntax errors."""
         invalid_code = """
@@ -178,6 +206,60 @@ result = eval("os.system('ls')")
         violations = result["security_violations"]
         assert len(violations) >= 2  # At least 2 blocked imports
     
+    async def test_repeated_violations_reported_per_line(self, ast_hook):
+        """Test that a repeated offence is reported once for each line."""
+        repeated_code = "\n".join('eval("1")' for _ in range(50))
+        payload = {"code": repeated_code}
+        result = await ast_hook.execute(payload)
+        
+        violations = result["security_violations"]
+        blocked = [v for v in violations if v["type"] == "blocked_call"]
+        assert [v["line"] for v in blocked] == list(range(1, 51))
+    
+    async def test_same_line_violations_deduplicated(self, ast_hook):
+        """Test that repeats of one offence on a line are reported once."""
+        payload = {"code": 'eval(eval(eval("1")))\n'}
+        result = await ast_hook.execute(payload)
+        
+        violations = result["security_violations"]
+        assert [v["line"] for v in violations if v["type"] == "blocked_call"] == [1]
+    
+    async def test_distinct_imports_on_one_line_reported(self, ast_hook):
+        """Test that each blocked module in one import statement is reported."""
+        payload = {"code": "import os, subprocess\n"}
+        result = await ast_hook.execute(payload)
+        
+        descriptions = [v["description"] for v in result["security_violations"]
+                        if v["type"] == "blocked_import"]
+        assert descriptions == [
+            "Import of blocked module: os",
+            "Import of blocked module: subprocess"
+        ]
+    
+    async def test_distinct_calls_on_one_line_reported(self, ast_hook):
+        """Test that different blocked calls on one line are all reported."""
+        payload = {"code": "eval('1'); exec('2')\n"}
+        result = await ast_hook.execute(payload)
+        
+        descriptions = [v["description"] for v in result["security_violations"]
+                        if v["type"] == "blocked_call"]
+        assert descriptions == [
+            "Call to blocked function: eval",
+            "Call to blocked function: exec"
+        ]
+    
+    async def test_distinct_patterns_in_one_string_reported(self, ast_hook):
+        """Test that every suspicious pattern in a string is reported."""
+        payload = {"code": "x = 'base64 then obfuscate'\n"}
+        result = await ast_hook.execute(payload)
+        
+        descriptions = [v["description"] for v in result["security_violations"]
+                        if v["type"] == "suspicious_pattern"]
+        assert descriptions == [
+            "Suspicious pattern detected: base64",
+            "Suspicious pattern detected: obfuscate"
+        ]
+    
     async def test_suspicious_function_name(self, ast_hook):
         """Test detection of suspicious function names."""
         suspicious_code = """
@@ -359,6 +441,17 @@ class TestBashGuardHook:
         violations = result["security_violations"]
         assert any(v["type"] == "redirection" for v in violations)
     
+    async def test_fail_fast_stops_at_first_violation(self, bash_config):
+        """Test that fail_fast reports only the first violation."""
+        hook = BashGuardHook({**bash_config, "fail_fast": True})
+        payload = {"command": "sudo cat /etc/shadow > /tmp/out"}
+        result = await hook.execute(payload)
+        
+        assert result["_halt"] is True
+        violations = result["security_violations"]
+        assert len(violations) == 1
+        assert violations[0]["type"] == "blocked_command"
+    
     def test_is_command_safe_safe(self, bash_hook):
         """Test is_command_safe with safe command."""
         assert bash_hook.is_command_safe("ls -la") is True
@@ -395,6 +488,17 @@ class TestSecurityViolation:
         assert violation.line_number == 10
         assert violation.description == "Import of blocked module: os"
         assert violation.severity == "high"
+    
+    def test_security_violation_uses_slots(self):
+        """Test security violation has no per-instance dict."""
+        violation = SecurityViolation(
+            violation_type="blocked_call",
+            line_number=1,
+            description="Call to blocked function: eval",
+            severity="high"
+        )
+        
+        assert not hasattr(violation, "__dict__")
 
 
 @pytest.mark.unit
@@ -413,4 +517,15 @@ class TestCommandViolation:
         assert violation.violation_type == "blocked_command"
         assert violation.command == "rm -rf /"
         assert violation.description == "Blocked command: rm"
-        assert violation.severity == "critical"
\ No newline at end of file
+        assert violation.severity == "critical"
+    
+    def test_command_violation_uses_slots(self):
+        """Test command violation has no per-instance dict."""
+        violation = CommandViolation(
+            violation_type="redirection",
+            command="ls > out",
+            description="I/O redirection detected",
+            severity="medium"
+        )
+        
+        assert not hasattr(violation, "__dict__")
\ No newline at end of file
@@ -0,0 +1,518 @@
+"""
+Unit Tests for Weaviate Write Buffering
+Module ID: APEX-TEST-WEAVIATE-001
+Version: 0.1.0
+"""
+
+import asyncio
+import sys
+import threading
+import types
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from src.memory import MemoryChunk
+from src.memory.backends.weaviate import WeaviateVectorStore
+
+
+class _StubBatch:
+    """Stand-in for the v3 client batcher, reporting results via the callback."""
+    
+    def __init__(self):
+        """Initialize an empty batcher."""
+        self.callback = None
+        self.flushes = []
+        self.rejected = set()
+        self.error = None
+        # Cleared to hold imports until the test sets it again
+        self.gate = threading.Event()
+        self.gate.set()
+        self._items = []
+        # Stored objects (id -> properties) for delete_objects, which
+        # removes at most delete_limit matches per request
+        self.objects = {}
+        self.delete_limit = 10000
+        self.delete_requests = []
+    
+    def configure(self, callback=None, **kwargs):
+        """Record the result callback."""
+        self.callback = callback
+    
+    def __enter__(self):
+        """Start collecting objects."""
+        self._items = []
+        return self
+    
+    def add_data_object(self, data_object, class_name, vector=None, uuid=None):
+        """Collect one object."""
+        self._items.append(uuid)
+    
+    def __exit__(self, *exc_info):
+        """Send the collected objects, reporting per-object errors."""
+        self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        self.flushes.append(list(self._items))
+        self.callback([
+            {"id": uuid, "result": {"errors": {"error": [{"message": "rejected"}]}}}
+            if uuid in self.rejected else {"id": uuid, "result": {}}
+            for uuid in self._items
+        ])
+        return False
+    
+    def delete_objects(self, class_name, where, output="minimal", dry_run=False):
+        """Delete up to delete_limit stored objects matching a where filter."""
+        self.delete_requests.append(where)
+        matches = [oid for oid, props in self.objects.items() if _matches(oid, props, where)]
+        for oid in matches[:self.delete_limit]:
+            del self.objects[oid]
+        successful = min(len(matches), self.delete_limit)
+        return {"results": {"matches": successful, "successful": successful, "failed": 0}}
+
+
+def _matches(oid, props, where):
+    """Evaluate the subset of where filters the store sends."""
+    if where["operator"] == "And":
+        return all(_matches(oid, props, operand) for operand in where["operands"])
+    field = where["path"][0]
+    current = oid if field == "id" else props.get(field)
+    value = next(v for k, v in where.items() if k.startswith("value"))
+    if where["operator"] == "ContainsAny":
+        return current in value
+    return current == value
+
+
+class _StubQuery:
+    """Stand-in for the v3 query builder, counting executed queries."""
+    
+    def __init__(self):
+        """Initialize with no queries run."""
+        self.calls = 0
+        # Called from inside do(), to simulate work landing mid-query
+        self.on_do = None
+    
+    def get(self, class_name, properties):
+        """Start a Get query."""
+        return self
+    
+    def with_where(self, where_filter):
+        """Add a where filter."""
+        return self
+    
+    def with_near_vector(self, near_vector):
+        """Add a near-vector clause."""
+        return self
+    
+    def with_limit(self, limit):
+        """Limit the results."""
+        return self
+    
+    def do(self):
+        """Run the query, returning a single match."""
+        self.calls += 1
+        if self.on_do is not None:
+            self.on_do()
+        return {"data": {"Get": {"MemoryChunk": [
+            {"_additional": {"id": f"hit-{self.calls}"}, "content": "cached"}
+        ]}}}
+
+
+def _chunk(memory_id):
+    """Build a memory chunk with a small embedding."""
+    return MemoryChunk(
+        id=memory_id,
+        content=f"content {memory_id}",
+        agent_id="agent-1",
+        task_id=None,
+        file_path=None,
+        timestamp=datetime(2025, 1, 1),
+        utility_score=0.5,
+        vector=[1.0, 0.0]
+    )
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    """Install a stub weaviate module and return its batcher."""
+    batch = _StubBatch()
+    client = Mock()
+    client.schema.get.return_value = {"class": "MemoryChunk"}
+    client.batch = batch
+    
+    weaviate = types.ModuleType("weaviate")
+    weaviate.Client = Mock(return_value=client)
+    config = types.ModuleType("weaviate.config")
+    config.ConnectionConfig = Mock()
+    config.Auth = Mock()
+    weaviate.config = config
+    monkeypatch.setitem(sys.modules, "weaviate", weaviate)
+    monkeypatch.setitem(sys.modules, "weaviate.config", config)
+    return batch
+
+
+@pytest.fixture
+def store(batch):
+    """Create a store that flushes at three chunks or after 20 ms."""
+    return WeaviateVectorStore({"flush_size": 3, "flush_ms": 20, "pool_size": 2})
+
+
+@pytest.mark.unit
+class TestWeaviateWriteBuffer:
+    """Test cases for buffered single writes."""
+    
+    async def test_flush_on_size(self, store, batch):
+        """Test that flush_size buffered writes are imported as one batch."""
+        ids = await asyncio.gather(*[store.add_memory(_chunk(f"m{i}")) for i in range(3)])
+        
+        assert ids == ["m0", "m1", "m2"]
+        assert batch.flushes == [["m0", "m1", "m2"]]
+    
+    async def test_flush_on_timer(self, store, batch):
+        """Test that a lone write is imported once flush_ms passes."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        
+        assert await store.add_memory(_chunk("m0")) == "m0"
+        
+        assert loop.time() - started >= 0.015
+        assert batch.flushes == [["m0"]]
+        assert store._flush_handle is None
+    
+    async def test_size_flush_cancels_timer(self, store, batch):
+        """Test that reaching flush_size does not leave a timer behind."""
+        await asyncio.gather(*[store.add_memory(_chunk(f"m{i}")) for i in range(3)])
+        await asyncio.sleep(0.05)
+        
+        assert batch.flushes == [["m0", "m1", "m2"]]
+        assert store._flush_handle is None
+    
+    async def test_per_id_errors(self, store, batch):
+        """Test that a rejected object fails only its own caller."""
+        batch.rejected.add("m1")
+        
+        results = await asyncio.gather(
+            *[store.add_memory(_chunk(f"m{i}")) for i in range(3)],
+            return_exceptions=True
+        )
+        
+        assert results[0] == "m0"
+        assert isinstance(results[1], RuntimeError)
+        assert "m1" in str(results[1])
+        assert results[2] == "m2"
+    
+    async def test_failed_import_fails_every_caller(self, store, batch):
+        """Test that a failed batch request fails all waiting callers."""
+        batch.error = ConnectionError("connection refused")
+        
+        results = await asyncio.gather(
+            *[store.add_memory(_chunk(f"m{i}")) for i in range(3)],
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(result, ConnectionError) for result in results)
+    
+    async def test_missing_vector_rejected(self, store, batch):
+        """Test that a chunk without a vector is rejected before buffering."""
+        chunk = _chunk("m0")
+        chunk.vector = None
+        
+        with pytest.raises(ValueError):
+            await store.add_memory(chunk)
+        assert store._pending == []
+
+
+@pytest.mark.unit
+class TestWeaviateClose:
+    """Test cases for WeaviateVectorStore.close."""
+    
+    async def test_close_flushes_pending(self, batch):
+        """Test that close imports writes still waiting for the timer."""
+        store = WeaviateVectorStore({"flush_size": 10, "flush_ms": 60000, "pool_size": 2})
+        writes = [asyncio.ensure_future(store.add_memory(_chunk(f"m{i}"))) for i in range(2)]
+        await asyncio.sleep(0)
+        
+        await store.close()
+        
+        assert batch.flushes == [["m0", "m1"]]
+        assert store._flush_handle is None
+        assert await asyncio.gather(*writes) == ["m0", "m1"]
+    
+    async def test_close_awaits_in_flight_flush(self, store, batch):
+        """Test that close waits for an import that is already running."""
+        batch.gate.clear()
+        writes = [asyncio.ensure_future(store.add_memory(_chunk(f"m{i}"))) for i in range(3)]
+        await asyncio.sleep(0)
+        assert len(store._flush_tasks) == 1
+        
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.02, batch.gate.set)
+        await store.close()
+        
+        assert not store._flush_tasks
+        assert batch.flushes == [["m0", "m1", "m2"]]
+        assert await asyncio.gather(*writes) == ["m0", "m1", "m2"]
+    
+    async def test_close_shuts_down_executor(self, store):
+        """Test that the worker pool accepts no work after close."""
+        await store.close()
+        
+        with pytest.raises(RuntimeError):
+            store._executor.submit(lambda: None)
+    
+    async def test_close_without_pending_writes(self, store, batch):
+        """Test that closing an idle store sends nothing."""
+        await store.close()
+        
+        assert batch.flushes == []
+
+
+@pytest.mark.unit
+class TestWeaviateQueryCache:
+    """Test cases for the similarity query cache."""
+    
+    @pytest.fixture
+    def cached_store(self, batch):
+        """Create a store with the query cache enabled."""
+        store = WeaviateVectorStore({"cache_size": 8, "cache_ttl": 30.0, "pool_size": 2})
+        store.client.query = _StubQuery()
+        return store
+    
+    async def test_disabled_by_default(self, store):
+        """Test that the cache is off unless cache_size is configured."""
+        store.client.query = _StubQuery()
+        
+        await store.search([1.0, 0.0])
+        await store.search([1.0, 0.0])
+        
+        assert store.cache_size == 0
+        assert store.client.query.calls == 2
+    
+    async def test_hit_for_near_identical_query(self, cached_store):
+        """Test that a repeated or near-identical query is served from cache."""
+        first = await cached_store.search([1.0, 0.0])
+        again = await cached_store.search([1.0, 0.0])
+        scaled = await cached_store.search([2.0, 0.001])
+        
+        assert cached_store.client.query.calls == 1
+        assert [m.id for m in again] == [m.id for m in first] == ["hit-1"]
+        assert [m.id for m in scaled] == ["hit-1"]
+    
+    async def test_miss_for_dissimilar_query(self, cached_store):
+        """Test that a query below cache_sim_threshold goes to Weaviate."""
+        await cached_store.search([1.0, 0.0])
+        results = await cached_store.search([1.0, 1.0])
+        
+        assert cached_store.client.query.calls == 2
+        assert [m.id for m in results] == ["hit-2"]
+    
+    async def test_miss_when_parameters_differ(self, cached_store):
+        """Test that the same vector with other parameters is not a hit."""
+        await cached_store.search([1.0, 0.0], top_k=5)
+        await cached_store.search([1.0, 0.0], top_k=3)
+        await cached_store.search([1.0, 0.0], top_k=5, min_similarity=0.5)
+        await cached_store.search([1.0, 0.0], top_k=5, filter_dict={"agent_id": "agent-1"})
+        await cached_store.search([1.0, 0.0], top_k=5, fields=["content"])
+        
+        assert cached_store.client.query.calls == 5
+        
+        await cached_store.search([1.0, 0.0], top_k=3)
+        assert cached_store.client.query.calls == 5
+    
+    async def test_entries_expire(self, batch):
+        """Test that entries older than cache_ttl are not served."""
+        store = WeaviateVectorStore({"cache_size": 8, "cache_ttl": 0.05, "pool_size": 2})
+        store.client.query = _StubQuery()
+        
+        await store.search([1.0, 0.0])
+        await store.search([1.0, 0.0])
+        assert store.client.query.calls == 1
+        
+        await asyncio.sleep(0.1)
+        await store.search([1.0, 0.0])
+        assert store.client.query.calls == 2
+    
+    async def test_writes_invalidate(self, cached_store):
+        """Test that a write drops cached results."""
+        await cached_store.search([1.0, 0.0])
+        await cached_store.add_memories_batch([_chunk("m0")])
+        await cached_store.search([1.0, 0.0])
+        
+        assert cached_store.client.query.calls == 2
+    
+    async def test_generation_guard_skips_stale_results(self, cached_store):
+        """Test that results are not cached when a write lands mid-query."""
+        cached_store.client.query.on_do = cached_store._invalidate_query_cache
+        await cached_store.search([1.0, 0.0])
+        
+        cached_store.client.query.on_do = None
+        await cached_store.search([1.0, 0.0])
+        await cached_store.search([1.0, 0.0])
+        
+        assert cached_store.client.query.calls == 2
+    
+    async def test_lru_eviction(self, batch):
+        """Test that the least recently used entry is evicted when full."""
+        store = WeaviateVectorStore({"cache_size": 2, "pool_size": 2})
+        store.client.query = _StubQuery()
+        
+        await store.search([1.0, 0.0])
+        await store.search([0.0, 1.0])
+        await store.search([1.0, 0.0])
+        await store.search([-1.0, 0.0])
+        assert store.client.query.calls == 3
+        
+        await store.search([1.0, 0.0])
+        assert store.client.query.calls == 3
+        await store.search([0.0, 1.0])
+        assert store.client.query.calls == 4
+
+
+@pytest.mark.unit
+class TestWeaviateWhereFilter:
+    """Test cases for typed where-filter values."""
+    
+    async def test_int_promoted_for_number_property(self, store):
+        """Test that an int compared to a number property is sent as valueNumber."""
+        where = store._build_where_filter({"utility_score": {"gte": 1}})
+        
+        assert where == {"path": ["utility_score"], "operator": "GreaterThanEqual", "valueNumber": 1.0}
+        assert type(where["valueNumber"]) is float
+    
+    async def test_float_for_number_property(self, store):
+        """Test that a float is sent as valueNumber."""
+        where = store._build_where_filter({"utility_score": {"lt": 0.5}})
+        
+        assert where == {"path": ["utility_score"], "operator": "LessThan", "valueNumber": 0.5}
+    
+    async def test_unknown_property_typed_from_value(self, store):
+        """Test that properties outside the schema fall back to the Python type."""
+        assert store._build_where_filter({"retries": 3})["valueInt"] == 3
+        assert store._build_where_filter({"ratio": 0.5})["valueNumber"] == 0.5
+        assert store._build_where_filter({"pinned": True})["valueBoolean"] is True
+        assert store._build_where_filter({"label": "x"})["valueText"] == "x"
+    
+    async def test_naive_datetime_taken_as_utc(self, store):
+        """Test that a naive datetime is sent as an RFC 3339 UTC date."""
+        where = store._build_where_filter({"timestamp": {"gt": datetime(2025, 1, 1, 12, 0)}})
+        
+        assert where["valueDate"] == "2025-01-01T12:00:00+00:00"
+    
+    async def test_aware_datetime_keeps_offset(self, store):
+        """Test that an aware datetime keeps its own offset."""
+        value = datetime(2025, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+        
+        where = store._build_where_filter({"timestamp": {"lte": value}})
+        
+        assert where["valueDate"] == "2025-01-01T12:00:00+02:00"
+    
+    async def test_text_fallback(self, store):
+        """Test that non-string values for text properties are sent as text."""
+        assert store._build_where_filter({"agent_id": 5})["valueText"] == "5"
+        assert store._build_where_filter({"other": object}) == {
+            "path": ["other"], "operator": "Equal", "valueText": str(object)
+        }
+    
+    async def test_combined_conditions(self, store):
+        """Test that several conditions are joined with And."""
+        where = store._build_where_filter({
+            "agent_id": "agent-1",
+            "utility_score": {"gte": 0, "lt": 1},
+            "status": {"bogus": "x"}
+        })
+        
+        assert where == {"operator": "And", "operands": [
+            {"path": ["agent_id"], "operator": "Equal", "valueText": "agent-1"},
+            {"path": ["utility_score"], "operator": "GreaterThanEqual", "valueNumber": 0.0},
+            {"path": ["utility_score"], "operator": "LessThan", "valueNumber": 1.0},
+        ]}
+    
+    async def test_server_schema_types_win(self, batch):
+        """Test that property types come from an existing server schema."""
+        client = sys.modules["weaviate"].Client.return_value
+        client.schema.get.return_value = {
+            "class": "MemoryChunk",
+            "properties": [{"name": "utility_score", "dataType": ["int"]}]
+        }
+        
+        store = WeaviateVectorStore({"pool_size": 2})
+        
+        assert store._build_where_filter({"utility_score": 2}) == {
+            "path": ["utility_score"], "operator": "Equal", "valueInt": 2
+        }
+
+
+@pytest.mark.unit
+class TestWeaviateBatchDelete:
+    """Test cases for delete_memories_batch and delete_where."""
+    
+    async def test_delete_memories_batch_slices_ids(self, store, batch, monkeypatch):
+        """Test that ids are sent in slices of MAX_DELETE_OBJECTS."""
+        monkeypatch.setattr(WeaviateVectorStore, "MAX_DELETE_OBJECTS", 4)
+        batch.objects = {f"m{i}": {} for i in range(12)}
+        
+        await store.delete_memories_batch([f"m{i}" for i in range(10)])
+        
+        slices = []
+        for request in batch.delete_requests:
+            if request["valueTextArray"] not in slices:
+                slices.append(request["valueTextArray"])
+        assert [len(s) for s in slices] == [4, 4, 2]
+        assert sorted(batch.objects) == ["m10", "m11"]
+    
+    async def test_delete_memories_batch_under_lower_server_limit(self, store, batch):
+        """Test that a slice is repeated when the server caps each request lower."""
+        batch.delete_limit = 3
+        batch.objects = {f"m{i}": {} for i in range(10)}
+        
+        await store.delete_memories_batch([f"m{i}" for i in range(8)])
+        
+        assert sorted(batch.objects) == ["m8", "m9"]
+    
+    async def test_delete_memories_batch_empty(self, store, batch):
+        """Test that an empty id list sends no request."""
+        await store.delete_memories_batch([])
+        
+        assert batch.delete_requests == []
+    
+    async def test_delete_where_returns_count(self, store, batch):
+        """Test that delete_where removes every match and counts them."""
+        batch.objects = {
+            "a": {"agent_id": "agent-1"},
+            "b": {"agent_id": "agent-2"},
+            "c": {"agent_id": "agent-1"},
+        }
+        
+        deleted = await store.delete_where({"agent_id": "agent-1"})
+        
+        assert deleted == 2
+        assert list(batch.objects) == ["b"]
+    
+    async def test_delete_where_under_lower_server_limit(self, store, batch):
+        """Test that delete_where keeps going when the server caps each request."""
+        batch.delete_limit = 4
+        batch.objects = {f"m{i}": {"status": "deprecated"} for i in range(10)}
+        batch.objects["keep"] = {"status": "active"}
+        
+        deleted = await store.delete_where({"status": "deprecated"})
+        
+        assert deleted == 10
+        assert list(batch.objects) == ["keep"]
+    
+    async def test_delete_where_requires_filter(self, store, batch):
+        """Test that an empty filter is rejected rather than deleting everything."""
+        with pytest.raises(ValueError):
+            await store.delete_where({})
+        assert batch.delete_requests == []
+    
+    async def test_delete_invalidates_query_cache(self, batch):
+        """Test that deletes drop cached search results."""
+        store = WeaviateVectorStore({"cache_size": 8, "pool_size": 2})
+        store.client.query = _StubQuery()
+        batch.objects = {"a": {"agent_id": "agent-1"}}
+        
+        await store.search([1.0, 0.0])
+        await store.delete_where({"agent_id": "agent-1"})
+        await store.search([1.0, 0.0])
+        
+        assert store.client.query.calls == 2